@@ -1,6 +1,11 @@
 """Core antenna physics engine — all calculation and tuning logic."""
+import copy
 import math
-from typing import List
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Final, List, NamedTuple
+
+import numpy as np
 
 from config import (
     BAND_DEFINITIONS, FREE_SPACE_GAIN_DBI, STANDARD_BOOM_11M_IN,
@@ -13,31 +18,57 @@ from models import (
 )
 
 
+# ── Physical Constants ──
+
+C_MPS: Final[float] = 299792458.0  # speed of light, m/s
+M_TO_IN: Final[float] = 39.3701
+TWO_PI: Final[float] = 2.0 * math.pi
+
+
 # ── Conversion Helpers ──
 
+# Metres per unit; an unlisted unit (e.g. "meters") passes the value through unchanged
+_HEIGHT_TO_M = {"ft": 0.3048, "inches": 0.0254}
+_BOOM_TO_M = {"mm": 0.001, "inches": 0.0254}
+_SPACING_TO_M = _HEIGHT_TO_M
+
 def convert_height_to_meters(value: float, unit: str) -> float:
-    if unit == "ft": return value * 0.3048
-    elif unit == "inches": return value * 0.0254
-    return value
+    factor = _HEIGHT_TO_M.get(unit)
+    return value * factor if factor else value
 
 def convert_boom_to_meters(value: float, unit: str) -> float:
-    if unit == "mm": return value * 0.001
-    elif unit == "inches": return value * 0.0254
-    return value
+    factor = _BOOM_TO_M.get(unit)
+    return value * factor if factor else value
 
 def convert_element_to_meters(value: float, unit: str) -> float:
     if unit == "inches": return value * 0.0254
     return value
 
 def convert_spacing_to_meters(value: float, unit: str) -> float:
-    if unit == "ft": return value * 0.3048
-    elif unit == "inches": return value * 0.0254
-    return value
+    factor = _SPACING_TO_M.get(unit)
+    return value * factor if factor else value
 
 
 
 # ── Shared Physics Helpers (used by both calculate and design_gamma_match) ──
 
+def _clamp(value: float, lo: float, hi: float) -> float:
+    """Clamp value to [lo, hi]; same result (and type) as max(lo, min(hi, value))."""
+    v = value if value < hi else hi
+    return v if v > lo else lo
+
+def _round_each(values, ndigits: int) -> np.ndarray:
+    """Array of Python round() per element (np.round rounds ties differently)."""
+    return np.array([round(v, ndigits) for v in np.asarray(values).tolist()])
+
+def _gamma_cap_per_inch(tube_id: float, rod_od: float) -> float:
+    """Gamma capacitor pF per inch of rod insertion (PTFE, er=2.1); needs tube_id > rod_od.
+
+    C = 2*pi*e0*er / ln(D/d), with ln(D/d) taken as log1p((D-d)/d) for accuracy at tight fits.
+    """
+    return 1.413 * 2.1 / math.log1p((tube_id - rod_od) / rod_od)
+
+
 def get_gamma_hardware_defaults(num_elements: int) -> dict:
     """Unified gamma match hardware defaults with per-element tube/rod sizing."""
     if num_elements <= 2:
@@ -117,7 +148,7 @@ def compute_feedpoint_impedance(num_elements: int, wavelength_m: float,
         factor = max(0.85, 0.85 + gap_wl * 0.5)
         r_feed *= factor
 
-    return round(max(12.0, min(73.0, r_feed)), 1)
+    return round(_clamp(r_feed, 12.0, 73.0), 1)
 
 
 def compute_element_resonant_freq(driven_length_in: float, frequency_mhz: float,
@@ -156,6 +187,9 @@ def compute_element_resonant_freq(driven_length_in: float, frequency_mhz: float,
 
 # ── Gain Model ──
 
+_FREE_SPACE_GAIN_KEYS = tuple(sorted(FREE_SPACE_GAIN_DBI))
+
+@lru_cache(maxsize=64)
 def get_free_space_gain(n: int) -> float:
     if n in FREE_SPACE_GAIN_DBI:
         return FREE_SPACE_GAIN_DBI[n]
@@ -163,13 +197,14 @@ def get_free_space_gain(n: int) -> float:
         return 4.0
     if n > 20:
         return 17.2 + 0.3 * (n - 20)
-    lower = max(k for k in FREE_SPACE_GAIN_DBI if k <= n)
-    upper = min(k for k in FREE_SPACE_GAIN_DBI if k >= n)
-    if lower == upper:
-        return FREE_SPACE_GAIN_DBI[lower]
+    # n falls strictly between two table keys
+    i = bisect_left(_FREE_SPACE_GAIN_KEYS, n)
+    lower = _FREE_SPACE_GAIN_KEYS[i - 1]
+    upper = _FREE_SPACE_GAIN_KEYS[i]
     frac = (n - lower) / (upper - lower)
     return round(FREE_SPACE_GAIN_DBI[lower] + frac * (FREE_SPACE_GAIN_DBI[upper] - FREE_SPACE_GAIN_DBI[lower]), 2)
 
+@lru_cache(maxsize=256)
 def get_standard_boom_in(n: int, wavelength_in: float) -> float:
     scale = wavelength_in / REF_WAVELENGTH_11M_IN
     base = STANDARD_BOOM_11M_IN.get(n, 150 + (n - 3) * 60)
@@ -178,39 +213,40 @@ def get_standard_boom_in(n: int, wavelength_in: float) -> float:
 
 # ── Ground Gain ──
 
+# (height in wavelengths, ground gain dB) breakpoints, linearly interpolated
+_GROUND_GAIN_V_POINTS = (
+    (0.00, 0.0), (0.10, 1.0), (0.25, 1.8), (0.50, 2.5),
+    (1.00, 2.8), (1.50, 2.5), (2.00, 2.6), (2.75, 2.5),
+)
+_GROUND_GAIN_H_POINTS = (
+    (0.00, 0.0), (0.25, 2.8), (0.55, 5.2), (1.00, 6.0),
+    (1.50, 5.5), (2.00, 5.9), (2.50, 5.7), (2.75, 5.8),
+)
+
+_GROUND_GAIN_V_HEIGHTS = tuple(h for h, _ in _GROUND_GAIN_V_POINTS)
+_GROUND_GAIN_H_HEIGHTS = tuple(h for h, _ in _GROUND_GAIN_H_POINTS)
+
+def _ground_gain_interp(h: float, points: tuple, heights: tuple) -> float:
+    """Linear interpolation for 0 < h < last breakpoint; a breakpoint uses the segment below it."""
+    i = bisect_left(heights, h) - 1
+    h0, g0 = points[i]
+    h1, g1 = points[i + 1]
+    frac = (h - h0) / (h1 - h0) if h1 != h0 else 0
+    return g0 + frac * (g1 - g0)
+
+@lru_cache(maxsize=256)
 def calculate_ground_gain(height_wavelengths: float, orientation: str = "horizontal") -> float:
     h = height_wavelengths
     if h <= 0:
         return 0.0
     if orientation == "vertical":
-        v_points = [
-            (0.00, 0.0), (0.10, 1.0), (0.25, 1.8), (0.50, 2.5),
-            (1.00, 2.8), (1.50, 2.5), (2.00, 2.6), (2.75, 2.5),
-        ]
-        if h >= v_points[-1][0]:
-            return round(v_points[-1][1], 2)
-        for i in range(len(v_points) - 1):
-            h0, g0 = v_points[i]
-            h1, g1 = v_points[i + 1]
-            if h0 <= h <= h1:
-                frac = (h - h0) / (h1 - h0) if h1 != h0 else 0
-                return round(g0 + frac * (g1 - g0), 2)
-        return round(v_points[-1][1], 2)
-    h_points = [
-        (0.00, 0.0), (0.25, 2.8), (0.55, 5.2), (1.00, 6.0),
-        (1.50, 5.5), (2.00, 5.9), (2.50, 5.7), (2.75, 5.8),
-    ]
-    if h >= h_points[-1][0]:
-        base = h_points[-1][1]
+        if h >= _GROUND_GAIN_V_HEIGHTS[-1]:
+            return round(_GROUND_GAIN_V_POINTS[-1][1], 2)
+        return round(_ground_gain_interp(h, _GROUND_GAIN_V_POINTS, _GROUND_GAIN_V_HEIGHTS), 2)
+    if h >= _GROUND_GAIN_H_HEIGHTS[-1]:
+        base = _GROUND_GAIN_H_POINTS[-1][1]
     else:
-        base = 0.0
-        for i in range(len(h_points) - 1):
-            h0, g0 = h_points[i]
-            h1, g1 = h_points[i + 1]
-            if h0 <= h <= h1:
-                frac = (h - h0) / (h1 - h0) if h1 != h0 else 0
-                base = g0 + frac * (g1 - g0)
-                break
+        base = _ground_gain_interp(h, _GROUND_GAIN_H_POINTS, _GROUND_GAIN_H_HEIGHTS)
     if orientation == "angle45":
         return round(max(0, base - 3.0), 2)
     return round(base, 2)
@@ -218,26 +254,30 @@ def calculate_ground_gain(height_wavelengths: float, orientation: str = "horizon
 
 # ── Boom Correction (G3SEK / DL6WU) ──
 
+_BOOM_MOUNT_MULTIPLIERS = {"bonded": 1.0, "insulated": 0.55, "nonconductive": 0.0}
+_BOOM_MOUNT_LABELS = {"bonded": "Bonded to Metal Boom", "insulated": "Insulated on Metal Boom", "nonconductive": "Non-Conductive Boom"}
+# Uncorrected (free-space length) notes: non-conductive boom vs insulated mount on metal
+_BOOM_NONCONDUCTIVE_NOTES = ("Elements match theoretical free-space dimensions", "More stable SWR across the band", "Higher achievable F/B ratio", "Non-conductive boom (PVC/wood/fiberglass) — no element coupling", "Add separate ground path for static/lightning protection")
+_BOOM_NONCONDUCTIVE_DESC = "Non-conductive boom — elements at free-space length, no correction needed. Cleanest, most predictable pattern."
+_BOOM_INSULATED_NOTES = ("Elements match theoretical free-space dimensions", "More stable SWR across the band", "Higher achievable F/B ratio", "Insulating sleeves reduce boom influence at each mount point", "Metal boom still provides partial static discharge path")
+_BOOM_INSULATED_DESC = "Insulated mount on metal boom — elements near free-space length. Pattern is cleaner and more predictable."
+
 def calculate_boom_correction(boom_dia_m: float, avg_element_dia_m: float, wavelength: float, boom_grounded: bool, boom_mount: str = "bonded") -> dict:
     mount = boom_mount
-    if mount not in ("bonded", "insulated", "nonconductive"):
+    if mount not in _BOOM_MOUNT_MULTIPLIERS:
         mount = "bonded" if boom_grounded else "nonconductive"
-    mount_multipliers = {"bonded": 1.0, "insulated": 0.55, "nonconductive": 0.0}
-    k = mount_multipliers.get(mount, 1.0)
-    mount_labels = {"bonded": "Bonded to Metal Boom", "insulated": "Insulated on Metal Boom", "nonconductive": "Non-Conductive Boom"}
+    k = _BOOM_MOUNT_MULTIPLIERS[mount]
     if k == 0 or boom_dia_m <= 0 or avg_element_dia_m <= 0:
         if mount == "nonconductive":
-            notes = ["Elements match theoretical free-space dimensions", "More stable SWR across the band", "Higher achievable F/B ratio", "Non-conductive boom (PVC/wood/fiberglass) — no element coupling", "Add separate ground path for static/lightning protection"]
-            desc = "Non-conductive boom — elements at free-space length, no correction needed. Cleanest, most predictable pattern."
+            notes, desc = _BOOM_NONCONDUCTIVE_NOTES, _BOOM_NONCONDUCTIVE_DESC
         else:
-            notes = ["Elements match theoretical free-space dimensions", "More stable SWR across the band", "Higher achievable F/B ratio", "Insulating sleeves reduce boom influence at each mount point", "Metal boom still provides partial static discharge path"]
-            desc = "Insulated mount on metal boom — elements near free-space length. Pattern is cleaner and more predictable."
-        return {"enabled": False, "boom_mount": mount, "boom_grounded": mount == "bonded", "swr_factor": 1.0, "gain_adj_db": 0.0, "fb_adj_db": 0.0, "impedance_shift_ohm": 0.0, "bandwidth_mult": 1.0, "correction_per_side_in": 0.0, "correction_total_in": 0.0, "corrected_elements": [], "description": desc, "practical_notes": notes}
+            notes, desc = _BOOM_INSULATED_NOTES, _BOOM_INSULATED_DESC
+        return {"enabled": False, "boom_mount": mount, "boom_grounded": mount == "bonded", "swr_factor": 1.0, "gain_adj_db": 0.0, "fb_adj_db": 0.0, "impedance_shift_ohm": 0.0, "bandwidth_mult": 1.0, "correction_per_side_in": 0.0, "correction_total_in": 0.0, "corrected_elements": [], "description": desc, "practical_notes": list(notes)}
     bd = boom_dia_m / wavelength
     c_frac = 12.5975 * bd - 114.5 * bd * bd
-    c_frac = max(0, min(c_frac, 0.5))
+    c_frac = _clamp(c_frac, 0, 0.5)
     c_frac *= k
-    boom_dia_in = boom_dia_m * 39.3701
+    boom_dia_in = boom_dia_m * M_TO_IN
     correction_per_side_in = c_frac * boom_dia_in
     dia_ratio = min(boom_dia_m / avg_element_dia_m, 5.0)
     correction_magnitude = min(c_frac * dia_ratio, 1.0)
@@ -246,7 +286,7 @@ def calculate_boom_correction(boom_dia_m: float, avg_element_dia_m: float, wavel
     fb_adj = max(-0.8 * correction_magnitude, -1.5)
     impedance_shift = max(-5.0 * correction_magnitude, -10.0)
     bandwidth_mult = max(1.0 - 0.03 * correction_magnitude, 0.92)
-    label = mount_labels.get(mount, mount)
+    label = _BOOM_MOUNT_LABELS[mount]
     total_corr = 2 * correction_per_side_in
     if correction_per_side_in < 0.05:
         desc = f"{label} — minimal correction at this frequency."
@@ -294,7 +334,7 @@ def compute_diameter_q_factor(avg_diameter_in: float, driven_length_in: float,
     # Bandwidth multiplier: BW ∝ 1/Q
     bandwidth_mult = omega_ref / omega if omega > 0 else 1.0
     # Clamp to realistic range (0.6x to 1.8x relative to reference)
-    bandwidth_mult = max(0.6, min(1.8, bandwidth_mult))
+    bandwidth_mult = _clamp(bandwidth_mult, 0.6, 1.8)
 
     # SWR curve exponent: controls V-shape (high) vs U-shape (low)
     # Reference 0.5" → exponent 1.6 (moderate V)
@@ -302,7 +342,7 @@ def compute_diameter_q_factor(avg_diameter_in: float, driven_length_in: float,
     # 0.25" → exponent ~2.0 (sharp V)
     base_exponent = 1.6
     swr_curve_exponent = base_exponent * q_ratio
-    swr_curve_exponent = max(1.0, min(2.5, swr_curve_exponent))
+    swr_curve_exponent = _clamp(swr_curve_exponent, 1.0, 2.5)
 
     # Description
     if bandwidth_mult > 1.10:
@@ -324,6 +364,16 @@ def compute_diameter_q_factor(avg_diameter_in: float, driven_length_in: float,
 
 # ── SWR Calculation ──
 
+# Piecewise-linear segments: segment i applies below _BREAKS[i] (the last is open-ended)
+_SWR_DEV_BREAKS = (0.005, 0.01, 0.02, 0.04, 0.08)
+_SWR_DEV_BASE = (1.0, 1.05, 1.15, 1.4, 2.0, 3.0)
+_SWR_DEV_START = (0.0, 0.005, 0.01, 0.02, 0.04, 0.08)
+_SWR_DEV_SLOPE = (10, 20, 25, 30, 25, 20)
+_HEIGHT_DIST_BREAKS = (0.1, 0.2)
+_HEIGHT_DIST_BASE = (0.90, 1.0, 1.15)
+_HEIGHT_DIST_START = (0.0, 0.1, 0.2)
+_HEIGHT_DIST_SLOPE = (1.0, 1.5, 1.0)
+
 def calculate_swr_from_elements(elements: List[ElementDimension], wavelength: float, taper_enabled: bool = False, height_wavelengths: float = 1.0) -> float:
     driven = None
     reflector = None
@@ -334,15 +384,11 @@ def calculate_swr_from_elements(elements: List[ElementDimension], wavelength: fl
         elif elem.element_type == "director": directors.append(elem)
     if not driven:
         return 2.0
-    driven_length_m = convert_element_to_meters(driven.length, "inches")
+    driven_length_m = driven.length * 0.0254
     ideal_driven = wavelength * 0.473
     deviation = abs(driven_length_m - ideal_driven) / ideal_driven
-    if deviation < 0.005: base_swr = 1.0 + (deviation * 10)
-    elif deviation < 0.01: base_swr = 1.05 + (deviation - 0.005) * 20
-    elif deviation < 0.02: base_swr = 1.15 + (deviation - 0.01) * 25
-    elif deviation < 0.04: base_swr = 1.4 + (deviation - 0.02) * 30
-    elif deviation < 0.08: base_swr = 2.0 + (deviation - 0.04) * 25
-    else: base_swr = 3.0 + (deviation - 0.08) * 20
+    i = bisect_right(_SWR_DEV_BREAKS, deviation)
+    base_swr = _SWR_DEV_BASE[i] + (deviation - _SWR_DEV_START[i]) * _SWR_DEV_SLOPE[i]
 
     # Element diameter effect on SWR sensitivity
     # Thicker elements have lower Q → less sensitive to length deviations
@@ -355,38 +401,67 @@ def calculate_swr_from_elements(elements: List[ElementDimension], wavelength: fl
     base_swr = 1.0 + (base_swr - 1.0) * q_swr_factor
 
     if reflector:
-        reflector_length_m = convert_element_to_meters(reflector.length, "inches")
+        reflector_length_m = reflector.length * 0.0254
         ideal_reflector = driven_length_m * 1.05
         reflector_deviation = abs(reflector_length_m - ideal_reflector) / ideal_reflector
         base_swr *= (1 + reflector_deviation * 0.5)
     if directors:
+        # Each director ideally 2% shorter than the one before, starting at 0.95x driven
         for i, director in enumerate(directors):
-            director_length_m = convert_element_to_meters(director.length, "inches")
+            director_length_m = director.length * 0.0254
             ideal_director = driven_length_m * (0.95 - i * 0.02)
             director_deviation = abs(director_length_m - ideal_director) / ideal_director
             base_swr *= (1 + director_deviation * 0.2)
     if reflector and driven:
         spacing = abs(driven.position - reflector.position)
-        spacing_m = convert_element_to_meters(spacing, "inches")
+        spacing_m = spacing * 0.0254
         ideal_spacing = wavelength * 0.2
         spacing_deviation = abs(spacing_m - ideal_spacing) / ideal_spacing
         base_swr *= (1 + spacing_deviation * 0.3)
-    height_factor = 1.0
     fractional_height = height_wavelengths % 0.5
     distance_from_optimal = min(fractional_height, 0.5 - fractional_height)
-    if distance_from_optimal < 0.1: height_factor = 0.90 + (distance_from_optimal * 1.0)
-    elif distance_from_optimal < 0.2: height_factor = 1.0 + (distance_from_optimal - 0.1) * 1.5
-    else: height_factor = 1.15 + (distance_from_optimal - 0.2) * 1.0
+    i = bisect_right(_HEIGHT_DIST_BREAKS, distance_from_optimal)
+    height_factor = _HEIGHT_DIST_BASE[i] + (distance_from_optimal - _HEIGHT_DIST_START[i]) * _HEIGHT_DIST_SLOPE[i]
     if height_wavelengths < 0.25:
         height_factor *= 1.3 + (0.25 - height_wavelengths) * 2
     base_swr *= height_factor
     if taper_enabled:
         base_swr *= 0.92
-    return round(max(1.0, min(base_swr, 5.0)), 2)
+    return round(_clamp(base_swr, 1.0, 5.0), 2)
 
 
 # ── Matching Network ──
 
+def _gamma_z0(driven_dia_in: float, rod_dia_in: float, rod_spacing_in: float) -> float:
+    """Z0 of the gamma section as a two-wire line with unequal conductors (300 Ω if too close)."""
+    geo_mean_dia = math.sqrt(driven_dia_in * rod_dia_in)
+    if rod_spacing_in > geo_mean_dia / 2:
+        return 276.0 * math.log10(2.0 * rod_spacing_in / geo_mean_dia)
+    return 300.0
+
+
+def _gamma_antenna_reactance(feedpoint_r: float, num_elements: int, operating_freq_mhz: float,
+                             element_resonant_freq_mhz: float, dia_q_info: dict = None) -> tuple:
+    """Driven-element reactance seen by the gamma match: (x_antenna, antenna_q).
+
+    X_ant = Q * R * (f/f_res - f_res/f) — capacitive if the element resonates above
+    the operating frequency. Q depends on element diameter and count.
+    """
+    antenna_q_base = 12.0 * dia_q_info["q_ratio"] if dia_q_info else 12.0
+    # Element count effect on Q
+    if num_elements <= 2: eq_mult = 0.7
+    elif num_elements <= 3: eq_mult = 1.0
+    elif num_elements <= 5: eq_mult = 1.0 + 0.2 * (num_elements - 3)
+    else: eq_mult = 1.4 + 0.15 * (num_elements - 5)
+    antenna_q_match = _clamp(antenna_q_base * eq_mult, 5.0, 60.0)
+    if element_resonant_freq_mhz > 0 and abs(element_resonant_freq_mhz - operating_freq_mhz) > 0.01:
+        fr_ratio = operating_freq_mhz / element_resonant_freq_mhz
+        x_antenna = antenna_q_match * feedpoint_r * (fr_ratio - 1.0 / fr_ratio)
+    else:
+        x_antenna = 0.0
+    return x_antenna, antenna_q_match
+
+
 def apply_matching_network(swr: float, feed_type: str, feedpoint_r: float = 25.0,
                            gamma_rod_dia: float = None, gamma_rod_spacing: float = None,
                            gamma_bar_pos: float = None, gamma_element_gap: float = None,
@@ -421,7 +496,7 @@ def apply_matching_network(swr: float, feed_type: str, feedpoint_r: float = 25.0
         max_insertion = tube_length - 0.5
 
         if gamma_element_gap is not None:
-            rod_insertion_in = max(0, min(gamma_element_gap, max_insertion))
+            rod_insertion_in = _clamp(gamma_element_gap, 0, max_insertion)
         else:
             rod_insertion_in = 8.0
         insertion_ratio = rod_insertion_in / max(max_insertion, 0.1)
@@ -429,7 +504,7 @@ def apply_matching_network(swr: float, feed_type: str, feedpoint_r: float = 25.0
         # Coaxial capacitor: C = 2*pi*e0*er*L / ln(D/d)
         rod_od_actual = rod_dia
         if rod_insertion_in > 0 and tube_id > rod_od_actual:
-            cap_per_inch = 1.413 * 2.1 / math.log(tube_id / rod_od_actual)
+            cap_per_inch = _gamma_cap_per_inch(tube_id, rod_od_actual)
             insertion_cap_pf_exact = cap_per_inch * rod_insertion_in
             insertion_cap_pf = round(insertion_cap_pf_exact, 1)
         else:
@@ -442,10 +517,7 @@ def apply_matching_network(swr: float, feed_type: str, feedpoint_r: float = 25.0
         # Driven element dia (d1) and gamma rod dia (d2) differ
         # Z0 = 276 * log10(2 * D / sqrt(d1 * d2))
         geo_mean_dia = math.sqrt(driven_element_dia_in * rod_dia)
-        if rod_spacing > geo_mean_dia / 2:
-            z0_gamma = 276.0 * math.log10(2.0 * rod_spacing / geo_mean_dia)
-        else:
-            z0_gamma = 300.0
+        z0_gamma = _gamma_z0(driven_element_dia_in, rod_dia, rod_spacing)
 
         # Step-up ratio from bar position geometry with rod coupling:
         # K = 1 + (bar_pos / half_element_length) * coupling_multiplier
@@ -462,13 +534,13 @@ def apply_matching_network(swr: float, feed_type: str, feedpoint_r: float = 25.0
         bar_ideal_inches = round(half_len * (k_ideal - 1.0) / coupling_multiplier, 2)
 
         # Shorted transmission line stub: X_stub = Z0 * tan(beta * L)
-        wavelength_m = 299792458.0 / (operating_freq_mhz * 1e6)
+        wavelength_m = C_MPS / (operating_freq_mhz * 1e6)
         bar_pos_m = bar_inches * 0.0254
-        beta_l = 2.0 * math.pi * bar_pos_m / wavelength_m
+        beta_l = TWO_PI * bar_pos_m / wavelength_m
         x_stub = z0_gamma * math.tan(beta_l)
 
         # Series capacitor: X_cap = -1/(2*pi*f*C)
-        omega = 2.0 * math.pi * operating_freq_mhz * 1e6
+        omega = TWO_PI * operating_freq_mhz * 1e6
         x_cap = -1.0 / (omega * (user_cap * 1e-12)) if user_cap > 0 else 0
 
         net_reactance = x_stub + x_cap
@@ -479,18 +551,8 @@ def apply_matching_network(swr: float, feed_type: str, feedpoint_r: float = 25.0
         # Antenna reactance at operating frequency (driven element may not be resonant here)
         # X_ant = Q * R * (f/f_res - f_res/f)  — capacitive if element resonates above operating freq
         # Q depends on element diameter, count, and spacing
-        antenna_q_base = 12.0 * dia_q_info["q_ratio"] if dia_q_info else 12.0
-        # Element count effect on Q
-        if num_elements <= 2: eq_mult = 0.7
-        elif num_elements <= 3: eq_mult = 1.0
-        elif num_elements <= 5: eq_mult = 1.0 + 0.2 * (num_elements - 3)
-        else: eq_mult = 1.4 + 0.15 * (num_elements - 5)
-        antenna_q_match = max(5.0, min(60.0, antenna_q_base * eq_mult))
-        if element_resonant_freq_mhz > 0 and abs(element_resonant_freq_mhz - operating_freq_mhz) > 0.01:
-            fr_ratio = operating_freq_mhz / element_resonant_freq_mhz
-            x_antenna = antenna_q_match * feedpoint_r * (fr_ratio - 1.0 / fr_ratio)
-        else:
-            x_antenna = 0.0
+        x_antenna, antenna_q_match = _gamma_antenna_reactance(
+            feedpoint_r, num_elements, operating_freq_mhz, element_resonant_freq_mhz, dia_q_info)
 
         # Transformed impedance at operating frequency
         # R_matched = feedpoint_R * K^2
@@ -561,7 +623,7 @@ def apply_matching_network(swr: float, feed_type: str, feedpoint_r: float = 25.0
             "tube_id": round(tube_id, 3),
             "tube_wall": wall, "rod_spacing": round(rod_spacing, 1),
             "rod_length": round(gamma_rod_length, 1), "tube_length": tube_length,
-            "teflon_length": teflon_sleeve_in, "cap_per_inch": round(1.413 * 2.1 / math.log(tube_id / rod_od_actual), 3) if tube_id > rod_od_actual else 0,
+            "teflon_length": teflon_sleeve_in, "cap_per_inch": round(_gamma_cap_per_inch(tube_id, rod_od_actual), 3) if tube_id > rod_od_actual else 0,
         }
         # Debug trace: every computation step in code execution order
         info["debug_trace"] = [
@@ -583,8 +645,8 @@ def apply_matching_network(swr: float, feed_type: str, feedpoint_r: float = 25.0
             {"step": 3, "label": "ROD INSERTION & CAPACITANCE", "items": [
                 {"var": "rod_insertion", "val": round(rod_insertion_in, 2), "unit": "in"},
                 {"var": "insertion_ratio", "val": round(insertion_ratio, 3), "unit": "", "formula": f"{round(rod_insertion_in,1)} / {round(max_insertion,1)}"},
-                {"var": "cap_per_inch", "val": round(1.413 * 2.1 / math.log(tube_id / rod_od_actual), 3) if tube_id > rod_od_actual else 0, "unit": "pF/in", "formula": f"1.413×2.1 / ln({round(tube_id,3)}/{round(rod_od_actual,3)})"},
-                {"var": "insertion_cap", "val": insertion_cap_pf, "unit": "pF", "formula": f"{round(1.413 * 2.1 / math.log(tube_id / rod_od_actual), 2) if tube_id > rod_od_actual else 0} × {round(rod_insertion_in,1)}"},
+                {"var": "cap_per_inch", "val": round(_gamma_cap_per_inch(tube_id, rod_od_actual), 3) if tube_id > rod_od_actual else 0, "unit": "pF/in", "formula": f"1.413×2.1 / ln({round(tube_id,3)}/{round(rod_od_actual,3)})"},
+                {"var": "insertion_cap", "val": insertion_cap_pf, "unit": "pF", "formula": f"{round(_gamma_cap_per_inch(tube_id, rod_od_actual), 2) if tube_id > rod_od_actual else 0} × {round(rod_insertion_in,1)}"},
                 {"var": "user_cap", "val": round(user_cap, 1), "unit": "pF"},
             ]},
             {"step": 4, "label": "Z0 (TWO-WIRE LINE)", "items": [
@@ -655,8 +717,8 @@ def apply_matching_network(swr: float, feed_type: str, feedpoint_r: float = 25.0
             hairpin_z0 = 200.0
 
         freq_hz = operating_freq_mhz * 1e6
-        wl_m = 299792458.0 / freq_hz if freq_hz > 0 else 11.0
-        wl_in = wl_m * 39.3701
+        wl_m = C_MPS / freq_hz if freq_hz > 0 else 11.0
+        wl_in = wl_m * M_TO_IN
 
         if feedpoint_r < 50.0 and feedpoint_r > 5.0:
             # L-network: step up R_feed to 50 ohms
@@ -665,13 +727,13 @@ def apply_matching_network(swr: float, feed_type: str, feedpoint_r: float = 25.0
             xc_needed = q_match * feedpoint_r
 
             # Ideal hairpin length for perfect match
-            ideal_length_in = (math.atan(xl_needed / hairpin_z0) / (2.0 * math.pi)) * wl_in
+            ideal_length_in = (math.atan(xl_needed / hairpin_z0) / TWO_PI) * wl_in
 
             # Actual hairpin length (user-provided or ideal)
             actual_length = hairpin_length_in if hairpin_length_in and hairpin_length_in > 0 else ideal_length_in
 
             # Actual X_L from hairpin at this length
-            beta_l = (2.0 * math.pi * actual_length) / wl_in
+            beta_l = (TWO_PI * actual_length) / wl_in
             if abs(beta_l) < math.pi / 2.0 - 0.01:
                 xl_actual = hairpin_z0 * math.tan(beta_l)
             else:
@@ -764,6 +826,106 @@ def apply_matching_network(swr: float, feed_type: str, feedpoint_r: float = 25.0
         return swr, {"type": "Direct Feed", "description": "Direct 50\u03a9 coax connection to driven element", "original_swr": round(swr, 3), "matched_swr": round(swr, 3), "bandwidth_effect": "No effect", "bandwidth_mult": 1.0}
 
 
+def _gamma_reactance_kernel(bars, z0_gamma: float, half_len: float, operating_freq_mhz: float) -> tuple:
+    """Step-up ratio K and shorted-stub reactance at each bar position (inches).
+
+    half_len is the driven half length already floored at 1". Returns (step_up, x_stub).
+    """
+    bars = np.asarray(bars, dtype=np.float64)
+    coupling_multiplier = z0_gamma / 73.0
+    step_up = 1.0 + (bars / half_len) * coupling_multiplier
+    wavelength_m = C_MPS / (operating_freq_mhz * 1e6)
+    x_stub = z0_gamma * np.tan(TWO_PI * (bars * 0.0254) / wavelength_m)
+    return step_up, x_stub
+
+
+def _gamma_swr_kernel(step_up, x_stub, cap_pf, feedpoint_r: float, x_antenna: float,
+                      operating_freq_mhz: float) -> tuple:
+    """Matched impedance and SWR for given K / X_stub and series cap (pF, > 0).
+
+    Returns (x_cap, z_r, z_x, gamma_mag, swr) unrounded, with |Γ| capped at 0.999.
+    """
+    omega = TWO_PI * operating_freq_mhz * 1e6
+    x_cap = -1.0 / (omega * (np.asarray(cap_pf, dtype=np.float64) * 1e-12))
+    z_r = feedpoint_r * (step_up * step_up)
+    z_x = (x_antenna * step_up) + x_stub + x_cap
+    z_sum = z_r + 50.0
+    denom = z_sum * z_sum + z_x * z_x
+    gamma_re = ((z_r - 50.0) * z_sum + z_x * z_x) / denom
+    gamma_im = (2 * z_x * 50.0) / denom
+    gamma_mag = np.minimum(np.sqrt(gamma_re * gamma_re + gamma_im * gamma_im), 0.999)
+    swr = (1 + gamma_mag) / (1 - gamma_mag)
+    return x_cap, z_r, z_x, gamma_mag, swr
+
+
+class _GammaPoint(NamedTuple):
+    """Gamma-match values at one (bar, cap) point, rounded as apply_matching_network reports them."""
+    step_up_ratio: float
+    x_stub: float
+    net_reactance: float
+    z_matched_r: float
+    z_matched_x: float
+    reflection_coefficient: float
+    return_loss_db: float
+    insertion_cap_pf: float
+
+
+def _gamma_point(bar: float, cap_pf: float, z0_gamma: float, half_len: float, feedpoint_r: float,
+                 x_antenna: float, operating_freq_mhz: float, insertion_cap_pf: float) -> tuple:
+    """Scalar gamma evaluation without building the full info dict.
+
+    insertion_cap_pf is passed through as reported. Returns (matched_swr, _GammaPoint).
+    """
+    k, xs = _gamma_reactance_kernel(bar, z0_gamma, half_len, operating_freq_mhz)
+    x_cap, z_r, z_x, gamma_mag, swr = _gamma_swr_kernel(k, xs, cap_pf, feedpoint_r, x_antenna, operating_freq_mhz)
+    k, xs, x_cap = float(k), float(xs), float(x_cap)
+    refl = round(float(gamma_mag), 6)
+    point = _GammaPoint(
+        step_up_ratio=round(k, 3), x_stub=round(xs, 2), net_reactance=round(xs + x_cap, 2),
+        z_matched_r=round(float(z_r), 2), z_matched_x=round(float(z_x), 2),
+        reflection_coefficient=refl, return_loss_db=min(round(-20 * math.log10(max(refl, 1e-8)), 2), 80.0),
+        insertion_cap_pf=insertion_cap_pf,
+    )
+    return max(1.0, round(float(swr), 3)), point
+
+
+# Reporting sweeps step 0-100% of their range in 5% steps
+_SWEEP_PCTS = np.arange(0, 105, 5, dtype=np.float64)
+
+
+def _gamma_report_sweeps(bar_min: float, bar_max: float, max_insertion: float, cap_per_inch: float,
+                         design_bar: float, design_cap_pf: float, z0_gamma: float, half_len: float,
+                         feedpoint_r: float, x_antenna: float, operating_freq_mhz: float) -> tuple:
+    """Gamma designer bar and insertion sweeps around the design point.
+
+    The bar sweep holds design_cap_pf, the insertion sweep holds design_bar; values are
+    rounded as _gamma_point reports them. Returns (bar_sweep, insertion_sweep).
+    """
+    bars = bar_min + (bar_max - bar_min) * _SWEEP_PCTS / 100.0
+    ins = max_insertion * _SWEEP_PCTS / 100.0
+    ins = np.where(ins <= 0, 0.001, ins)
+    caps = ins * cap_per_inch
+    # One kernel pass over both sweeps: the bar points first, then the insertion points
+    k, xs = _gamma_reactance_kernel(np.concatenate((bars, np.full_like(ins, design_bar))),
+                                    z0_gamma, half_len, operating_freq_mhz)
+    all_caps = np.concatenate((np.full_like(bars, design_cap_pf), caps))
+    all_caps = np.where(all_caps > 0, all_caps, 0.001)
+    x_cap, z_r, _, _, swr = _gamma_swr_kernel(k, xs, all_caps, feedpoint_r, x_antenna, operating_freq_mhz)
+    x_net = (xs + x_cap).tolist()
+    swr = [max(1.0, round(v, 3)) for v in swr.tolist()]
+    n = len(_SWEEP_PCTS)
+    bar_sweep = [
+        {"bar_inches": round(b, 2), "k": round(kb, 3), "r_matched": round(r, 2),
+         "x_net": round(x, 2), "swr": sw}
+        for b, kb, r, x, sw in zip(bars.tolist(), k[:n].tolist(), z_r[:n].tolist(), x_net[:n], swr[:n])
+    ]
+    ins_sweep = [
+        {"insertion_inches": round(i, 2), "cap_pf": round(c, 2), "x_net": round(x, 2), "swr": sw}
+        for i, c, x, sw in zip(ins.tolist(), caps.tolist(), x_net[n:], swr[n:])
+    ]
+    return bar_sweep, ins_sweep
+
+
 # ── Dual Polarity ──
 
 def calculate_dual_polarity_gain(n_per_pol: int, gain_h_single: float) -> dict:
@@ -784,11 +946,132 @@ def calculate_swr_at_frequency(freq: float, center_freq: float, bandwidth: float
     return min(swr, 10.0)
 
 
+# ── Impedance Sweep Kernel ──
+
+# Shared sweep axes: ±30 channels around center, or 201 points across swr_span_mhz
+_CHANNEL_OFFSETS = np.arange(-30, 31, dtype=np.float64)
+_CHANNEL_INDEX = tuple(range(-30, 31))
+_SPAN_POINTS = 201
+_SPAN_OFFSETS = np.arange(_SPAN_POINTS, dtype=np.float64)
+_SPAN_INDEX = tuple(i - _SPAN_POINTS // 2 for i in range(_SPAN_POINTS))
+
+def _smith_sweep_kernel(freqs: np.ndarray, res_freq: float, q: float, feed_r: float, z_0: float,
+                        feed_mode: int = 0, step_up: float = 1.0, bar_pos_in: float = 13.0,
+                        cap_pf: float = 0.0, z0_gamma: float = 300.0, tuning_quality: float = 1.0):
+    """Feedpoint impedance and reflection coefficient across a frequency sweep.
+
+    Pure-numeric core of the Smith chart sweep: takes only floats and a float64
+    frequency array (MHz) and returns ``(r, x, gamma_re, gamma_im, omega)`` arrays.
+    feed_mode: 0 = direct/untuned, 1 = tuned gamma match, 2 = tuned hairpin.
+    """
+    if res_freq > 0:
+        fr = freqs / res_freq
+        sc_x = q * feed_r * (fr - np.reciprocal(fr))
+    else:
+        sc_x = np.zeros_like(freqs)
+    sc_r = np.full_like(freqs, feed_r)
+    if feed_mode == 1:
+        freq_hz = freqs * 1e6
+        wavelength_m = C_MPS / freq_hz
+        beta_l = TWO_PI * (bar_pos_in * 0.0254) / wavelength_m
+        x_stub = z0_gamma * np.tan(beta_l)
+        if cap_pf > 0:
+            x_cap = -1.0 / ((TWO_PI * freq_hz) * (cap_pf * 1e-12))
+        else:
+            x_cap = 0
+        sc_r = sc_r * (step_up ** 2)
+        sc_x = (sc_x * step_up) + x_stub + x_cap
+    elif feed_mode == 2:
+        sc_x = sc_x * 0.10
+        sc_r = np.full_like(freqs, 50.0 * (1.0 + (1.0 - tuning_quality) * 0.25))
+    sc_x_sq = np.square(sc_x)
+    denom_r = np.square(sc_r + z_0) + sc_x_sq
+    safe = denom_r > 0
+    denom_safe = np.where(safe, denom_r, 1.0)
+    g_re = np.where(safe, ((sc_r - z_0) * (sc_r + z_0) + sc_x_sq) / denom_safe, 0.0)
+    g_im = np.where(safe, (2 * sc_x * z_0) / denom_safe, 0.0)
+    omega = TWO_PI * freqs * 1e6
+    return sc_r, sc_x, g_re, g_im, omega
+
+
+# ── Far Field Pattern Tables ──
+
+# Azimuth sampled every 5°. The lobe shapes depend only on the angle (and on
+# whether there is a reflector / only two elements); F/B and F/S scale them per design.
+_FAR_ANGLES = tuple(range(0, 361, 5))
+_FAR_COS = [math.cos(math.radians(a)) for a in _FAR_ANGLES]
+_FAR_IS_BACK = np.array([90 < a < 270 for a in _FAR_ANGLES])
+_FAR_IS_SIDE = np.array([60 < a < 120 or 240 < a < 300 for a in _FAR_ANGLES])
+_FAR_NOREFL_2EL_MAG = np.array([(max(0.2, 0.6 + 0.4 * c) ** 1.5) * 100 for c in _FAR_COS])
+_FAR_NOREFL_FORWARD = np.array([max(0, c) ** 1.5 if c >= 0 else 0 for c in _FAR_COS], dtype=np.float64)
+_FAR_REFL_2EL_MAG = np.array([(max(0, (c + 0.3) / 1.3) ** 2) * 100 for c in _FAR_COS], dtype=np.float64)
+_FAR_REFL_MAIN_LOBE = np.array([max(0, c ** 2) for c in _FAR_COS], dtype=np.float64)
+
+def _far_field_kernel(n: int, has_reflector: bool, back_attenuation: float, side_attenuation: float):
+    """Azimuth pattern magnitudes (%) at each _FAR_ANGLES sample, before the 1% floor.
+
+    Returns ``(magnitudes, side_floored)``: the float64 array and the indices whose
+    side lobe was raised to the 25% floor (reported as the int 25).
+    """
+    if not has_reflector:
+        if n == 2:
+            return _FAR_NOREFL_2EL_MAG, []
+        back_level = 0.3 + 0.1 * min(n - 2, 5)
+        far_mag = np.where(_FAR_IS_BACK, np.maximum(_FAR_NOREFL_FORWARD, back_level), np.maximum(_FAR_NOREFL_FORWARD, 0.1)) * 100
+        return far_mag, np.flatnonzero(_FAR_IS_SIDE & (far_mag < 25)).tolist()
+    if n == 2:
+        return _FAR_REFL_2EL_MAG, []
+    far_mag = np.where(_FAR_IS_BACK, _FAR_REFL_MAIN_LOBE * back_attenuation * 100, _FAR_REFL_MAIN_LOBE * 100)
+    return np.where(_FAR_IS_SIDE, far_mag * side_attenuation, far_mag), []
+
+
+# ── Elevation Pattern Tables ──
+
+# Upper half-plane sampled every 2°: 0..90 is the front (main beam) side, 92..180
+# is behind the antenna measured from the back horizon. Elevation sin() and the
+# Yagi element factor max(0.05, cos(0.7·θ)^1.5) do not depend on the design.
+_ELEV_FRONT_ANGLES = tuple(range(0, 181, 2))
+_ELEV_BELOW_ANGLES = tuple(range(182, 361, 2))
+_ELEV_IS_BACK = np.array([a > 90 for a in _ELEV_FRONT_ANGLES])
+_ELEV_SIN_FRONT = np.array([math.sin(math.radians(a if a <= 90 else 180 - a)) for a in _ELEV_FRONT_ANGLES])
+_ELEV_ELEMENT_FRONT = np.array([max(0.05, math.cos(math.radians(a if a <= 90 else 180 - a) * 0.7) ** 1.5)
+                                for a in _ELEV_FRONT_ANGLES])
+
+
 # ── Wind Load (EIA/TIA-222) ──
 
+_WIND_RATING_MPHS = (50, 70, 80, 90, 100, 120)
+_WIND_RATING_KEYS = tuple(str(mph) for mph in _WIND_RATING_MPHS)
+# Dynamic pressure (psf) at each rated wind speed
+_WIND_RATING_PSF = 0.00256 * np.array(_WIND_RATING_MPHS, dtype=np.float64) ** 2
+
+def _survival_mph(cd: float, area_sqft: float, boom_length_ft: float) -> int:
+    """Highest whole mph in 31-120 with force <= 200 lbs and torque <= 400 ft-lbs (120 if none).
+
+    Both grow with mph^2, so the limit is solved directly; the estimate is then nudged
+    against the exact force/torque expressions so boundary rounding matches a step-down scan.
+    """
+    def within_limits(mph: int) -> bool:
+        force = 0.00256 * mph**2 * cd * area_sqft
+        return force <= 200 and force * (boom_length_ft / 2) <= 400
+
+    drag_per_mph2 = 0.00256 * cd * area_sqft
+    if drag_per_mph2 <= 0:
+        return 120
+    mph2_limit = 200 / drag_per_mph2
+    if boom_length_ft > 0:
+        mph2_limit = min(mph2_limit, 400 / (drag_per_mph2 * (boom_length_ft / 2)))
+    mph = max(30, min(120, int(math.sqrt(mph2_limit))))
+    while mph < 120 and within_limits(mph + 1):
+        mph += 1
+    while mph > 30 and not within_limits(mph):
+        mph -= 1
+    return mph if mph > 30 else 120
+
 def calculate_wind_load(elements: list, boom_dia_in: float, boom_length_in: float, is_dual: bool = False, num_stacked: int = 1) -> dict:
     total_element_area_sqin = 0
     element_weight_lbs = 0
+    longest_element = 0
     for e in elements:
         length_in = float(e.get('length', 0) if isinstance(e, dict) else e.length)
         dia_in = float(e.get('diameter', 0.5) if isinstance(e, dict) else e.diameter)
@@ -796,6 +1079,7 @@ def calculate_wind_load(elements: list, boom_dia_in: float, boom_length_in: floa
         total_element_area_sqin += area
         volume = math.pi * (dia_in/2)**2 * length_in
         element_weight_lbs += volume * 0.098
+        if length_in > longest_element: longest_element = length_in
     if is_dual:
         total_element_area_sqin *= 2
         element_weight_lbs *= 2
@@ -821,24 +1105,10 @@ def calculate_wind_load(elements: list, boom_dia_in: float, boom_length_in: floa
         total_area_sqft *= num_stacked
         total_weight_lbs *= num_stacked
     cd = 1.2
-    wind_ratings = {}
-    for mph in [50, 70, 80, 90, 100, 120]:
-        pressure_psf = 0.00256 * mph**2
-        force_lbs = pressure_psf * cd * total_area_sqft
-        torque_ft_lbs = force_lbs * (boom_length_ft / 2)
-        wind_ratings[str(mph)] = {"force_lbs": round(force_lbs, 1), "torque_ft_lbs": round(torque_ft_lbs, 1)}
-    survival_mph = 120
-    for mph in range(120, 30, -1):
-        pressure_psf = 0.00256 * mph**2
-        force = pressure_psf * cd * total_area_sqft
-        torque = force * (boom_length_ft / 2)
-        if force <= 200 and torque <= 400:
-            survival_mph = mph
-            break
-    longest_element = 0
-    for e in elements:
-        length_in = float(e.get('length', 0) if isinstance(e, dict) else e.length)
-        if length_in > longest_element: longest_element = length_in
+    force_lbs = _WIND_RATING_PSF * cd * total_area_sqft
+    torque_ft_lbs = force_lbs * (boom_length_ft / 2)
+    wind_ratings = {key: {"force_lbs": round(f, 1), "torque_ft_lbs": round(t, 1)} for key, f, t in zip(_WIND_RATING_KEYS, force_lbs.tolist(), torque_ft_lbs.tolist())}
+    survival_mph = _survival_mph(cd, total_area_sqft, boom_length_ft)
     turn_radius_in = math.sqrt((longest_element/2)**2 + (boom_length_in/2)**2)
     turn_radius_ft = turn_radius_in / 12
     return {"total_area_sqft": round(total_area_sqft, 2), "total_weight_lbs": round(total_weight_lbs, 1), "element_weight_lbs": round(element_weight_lbs, 1), "boom_weight_lbs": round(boom_weight_lbs, 1), "hardware_weight_lbs": round(hardware_weight_lbs + truss_weight_lbs, 1), "has_truss": boom_length_ft > 12, "boom_length_ft": round(boom_length_ft, 1), "turn_radius_ft": round(turn_radius_ft, 1), "turn_radius_in": round(turn_radius_in, 1), "survival_mph": survival_mph, "wind_ratings": wind_ratings, "num_stacked": num_stacked, "drag_coefficient": cd}
@@ -933,48 +1203,191 @@ def calculate_stacked_beamwidth(base_beamwidth: float, num_antennas: int, spacin
     elif spacing_wavelengths > 1.0: narrowing_factor *= 0.9
     return round(max(base_beamwidth / narrowing_factor, 15), 1)
 
+def _stacked_array_factor(angles_deg, num_antennas: int, spacing_wavelengths: float, vertical: bool) -> np.ndarray:
+    """|AF| of a uniform in-phase stack at each pattern angle (1.0 where sin(psi/2) ~ 0)."""
+    theta_rad = np.radians(np.asarray(angles_deg, dtype=np.float64))
+    psi = TWO_PI * spacing_wavelengths * (np.sin(theta_rad) if vertical else np.cos(theta_rad))
+    half_psi = psi / 2
+    sin_half = np.sin(half_psi)
+    broadside = np.abs(sin_half) < 0.001
+    af = np.abs(np.sin(num_antennas * half_psi) / (num_antennas * np.where(broadside, 1.0, sin_half)))
+    return np.where(broadside, 1.0, af)
+
+
 def generate_stacked_pattern(base_pattern: List[dict], num_antennas: int, spacing_wavelengths: float, orientation: str) -> List[dict]:
-    stacked_pattern = []
-    for point in base_pattern:
-        angle = point["angle"]
-        base_mag = point["magnitude"]
-        theta_rad = math.radians(angle)
-        if orientation == "vertical":
-            psi = 2 * math.pi * spacing_wavelengths * math.sin(theta_rad)
-        else:
-            psi = 2 * math.pi * spacing_wavelengths * math.cos(theta_rad)
-        half_psi = psi / 2
-        if abs(math.sin(half_psi)) < 0.001:
-            array_factor = 1.0
-        else:
-            array_factor = abs(math.sin(num_antennas * half_psi) / (num_antennas * math.sin(half_psi)))
-        stacked_mag = max(base_mag * array_factor, 1.0)
-        stacked_pattern.append({"angle": angle, "magnitude": round(stacked_mag, 1)})
-    max_mag = max(p["magnitude"] for p in stacked_pattern)
+    angles = [p["angle"] for p in base_pattern]
+    array_factor = _stacked_array_factor(angles, num_antennas, spacing_wavelengths, orientation == "vertical")
+    base_mag = np.fromiter((p["magnitude"] for p in base_pattern), dtype=np.float64, count=len(base_pattern))
+    # Stacked magnitudes are floored at 1.0 and rounded before normalizing to the peak
+    stacked_mag = _round_each(np.maximum(base_mag * array_factor, 1.0), 1)
+    max_mag = stacked_mag.max() if len(stacked_mag) else 0.0
     if max_mag > 0:
-        for p in stacked_pattern:
-            p["magnitude"] = round(p["magnitude"] / max_mag * 100, 1)
-    return stacked_pattern
+        stacked_mag = stacked_mag / max_mag * 100
+    return [{"angle": angle, "magnitude": round(mag, 1)} for angle, mag in zip(angles, stacked_mag.tolist())]
+
+
+
+# Feed-system sub-dicts depend only on the array size (and wavelength); cached per
+# input and copied by the caller so responses never share a mutable dict.
+@lru_cache(maxsize=32)
+def _stacking_phasing_block(num_antennas: int) -> dict:
+    return {"requirement": "0 deg phase — all feed lines identical length", "cable_note": "Cable lengths must match to the millimeter for proper phasing", "combiner": f"{num_antennas}:1 Hybrid Splitter/Combiner or Power Divider"}
+
+
+@lru_cache(maxsize=32)
+def _stacking_power_splitter_block(num_antennas: int, wavelength_in: float, wavelength_ft: float) -> dict:
+    return {"type": f"{num_antennas}:1 Power Splitter/Combiner", "input_impedance": "50 ohm", "combined_load": f"{round(50 / num_antennas, 1)} ohm (parallel)", "matching_method": "Quarter-wave (lambda/4) transformer", "quarter_wave_ft": round(wavelength_ft * 0.25, 1), "quarter_wave_in": round(wavelength_in * 0.25, 1), "power_per_antenna_100w": round(100 / num_antennas, 1), "power_per_antenna_1kw": round(1000 / num_antennas, 1), "phase_lines": "All feed lines must be identical length for 0 deg phase shift", "min_power_rating": f"{round(1000 / num_antennas * 1.5)} W per port recommended", "isolation_note": "Port isolation prevents mismatch on one antenna from degrading others"}
+
+
+def _vertical_stack_notes(stacking, wavelength_ft, spacing_wavelengths, iso_label, close_coupling, center_freq) -> dict:
+    one_wl_ft = round(wavelength_ft, 1)
+    alignment_status = "Optimal collinear" if 0.8 <= spacing_wavelengths <= 1.2 else ("Acceptable" if 0.5 <= spacing_wavelengths <= 2.0 else "Sub-optimal")
+    return {"alignment": "COLLINEAR — antennas must be on the same vertical axis", "effect": "Narrows vertical beamwidth, focusing power toward the horizon", "one_wavelength_ft": f"{one_wl_ft} ft (1\u03bb at {center_freq} MHz)", "alignment_status": alignment_status, "isolation": f"{iso_label} isolation at current spacing", "far_field": {"elevation": "Compresses toward horizon", "azimuth": "Remains omnidirectional (360\u00b0)", "summary": "Vertical collinear stack: Maximum distance in ALL directions"}, "stagger_warning": "DO NOT offset horizontally", "coupling_warning": "Below 0.25\u03bb spacing causes severe mutual coupling" if close_coupling else "", "feed_line_note": "Feed lines MUST be identical length and type", "best_practice": f"Ideal spacing: ~1\u03bb ({one_wl_ft} ft center-to-center)"}
+
+
+def _horizontal_stack_notes(stacking, wavelength_ft, spacing_wavelengths, iso_label, close_coupling, center_freq) -> dict:
+    return {"effect": "Narrows horizontal beamwidth", "far_field": {"elevation": "Stays wide", "azimuth": "Becomes directional with lobes and nulls", "summary": "Horizontal stack: Intentional coverage in specific directions only"}, "tradeoff": "Sacrifices omnidirectional coverage for directional gain", "feed_line_note": "Feed lines MUST be identical length and type", "isolation": f"{iso_label} isolation at current spacing"}
+
+
+def _quad_stack_notes(stacking, wavelength_ft, spacing_wavelengths, iso_label, close_coupling, center_freq) -> dict:
+    h_spacing_val = stacking.h_spacing if stacking.h_spacing else stacking.spacing
+    h_spacing_unit = stacking.h_spacing_unit if stacking.h_spacing else stacking.spacing_unit
+    return {"layout": "2x2 H-Frame (2 vertical x 2 horizontal)", "effect": "Narrows BOTH vertical and horizontal beamwidth", "v_spacing": f"{stacking.spacing} {stacking.spacing_unit} (vertical)", "h_spacing": f"{h_spacing_val} {h_spacing_unit} (horizontal)", "h_frame_note": "Two antennas on horizontal cross-arm, two stacked vertically on mast", "isolation": f"{iso_label} vertical isolation", "coupling_warning": "Below 0.25 lambda spacing causes severe mutual coupling" if close_coupling else "", "identical_note": "All 4 antennas MUST be identical models", "phasing_note": "Use 4-way equal-length phasing harness"}
+
+
+# Stack layout ("quad" overrides orientation) -> (stacking_info key, notes builder)
+_STACKING_LAYOUT_NOTES = {
+    "vertical": ("vertical_notes", _vertical_stack_notes),
+    "horizontal": ("horizontal_notes", _horizontal_stack_notes),
+    "quad": ("quad_notes", _quad_stack_notes),
+}
 
 
 # ════════════════════════════════════════════════════════════════
 # Main calculation function — calculate_antenna_parameters
 # ════════════════════════════════════════════════════════════════
 
+# Coax feedline loss table (keys are normalized: lowercase, no '-', '/' or spaces)
+# key -> (display name, loss dB per 100 ft, power rating W, velocity factor)
+_COAX_LOSS_TABLE = {
+    "ldf550a": ("LDF5-50A 7/8\" Heliax", 0.22, 14000, 0.89),
+    "ldf450a": ("LDF4-50A 1/2\" Heliax", 0.41, 4800, 0.88),
+    "rg213": ("RG-213/U", 1.0, 1000, 0.66),
+    "rg213u": ("RG-213/U", 1.0, 1000, 0.66),
+    "rg8": ("RG-8/U", 1.0, 1000, 0.66),
+    "rg8u": ("RG-8/U", 1.0, 1000, 0.66),
+    "rg8x": ("RG-8X Mini-8", 1.6, 300, 0.78),
+    "rg8xmini8": ("RG-8X Mini-8", 1.6, 300, 0.78),
+    "rg58": ("RG-58/U", 2.4, 200, 0.66),
+    "rg58u": ("RG-58/U", 2.4, 200, 0.66),
+}
+_COAX_KEY_STRIP = str.maketrans('', '', '-/ ')
+
+# Ground type -> (conductivity S/m, relative permittivity, reflection coeff, takeoff angle adj deg)
+_GROUND_FACTORS = {
+    "wet": (0.03, 30, 0.95, -3),
+    "average": (0.005, 13, 0.85, 0),
+    "dry": (0.001, 5, 0.70, 5),
+}
+# Layout order of radial bearings (the first num_radials are listed)
+_RADIAL_DIRECTIONS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW", "NNE", "ENE", "ESE", "SSE", "SSW", "WSW", "WNW", "NNW", "N2", "E2")
+# Ground type -> ground-reflection gain scale
+_GROUND_TYPE_SCALES = {"wet": 1.15, "average": 1.0, "dry": 0.70}
+# Ground type -> (radial SWR improvement, radial efficiency bonus %) at 8 radials
+_GROUND_RADIAL_IMPROVEMENT = {
+    "wet": (0.05, 8),
+    "average": (0.03, 5),
+    "dry": (0.01, 2),
+}
+
+# dB → linear: 10**(x/10) == exp(x * ln10/10), 10**(x/20) == exp(x * ln10/20)
+_LN10_OVER_10 = math.log(10.0) / 10.0
+_LN10_OVER_20 = math.log(10.0) / 20.0
+
+
+# Receive noise by polarization: orientation -> (level, description)
+_NOISE_TABLE = {
+    "dual": ("Moderate", "Dual polarity receives both H and V — moderate noise, excellent for fading/skip"),
+    "vertical": ("High", "Vertical polarization picks up more man-made noise (QRN)"),
+    "angle45": ("Moderate", "45\u00b0 slant receives both polarizations — moderate noise"),
+}
+_NOISE_DEFAULT = ("Low", "Horizontal polarization has a quieter receive noise floor")
+
+# Rating ladders as sorted thresholds: bisect_left for "x <= t" bands, bisect_right for "x < t"
+_SWR_THRESHOLDS = (1.1, 1.3, 1.5, 2.0)
+_SWR_LABELS = ("Perfect", "Excellent", "Very Good", "Good", "Fair")
+_STACK_SPACING_THRESHOLDS = (0.25, 0.5, 1.0, 2.0)
+_STACK_SPACING_LABELS = ("Too close — high mutual coupling", "Minimum — some coupling", "Good", "Optimal", "Wide — diminishing returns")
+_TAKEOFF_THRESHOLDS = (10, 15, 18, 22, 28, 35, 50, 70)
+_TAKEOFF_LABELS = (
+    "Elite (Extremely low angle, massive DX)", "Deep DX (Reaching other continents)",
+    "DX Sweet Spot (Maximum ground gain)", "Strong Mid-Range (Continent-wide skip)",
+    "Regional (Good local/statewide skip)", "Minimum (Moderate skip, safe from detuning)",
+    "Medium (Regional/DX mix)", "High (Near vertical, short distance)", "Inefficient (High ground absorption)",
+)
+_HEIGHT_PERF_THRESHOLDS = (0.25, 0.40, 0.55, 0.70, 0.85, 1.05, 1.25, 1.75, 2.5)
+_HEIGHT_PERF_LABELS = (
+    "Inefficient: Below minimum height. Ground absorption detunes elements.",
+    "Near Vertical: High-angle signal, very short distance only.",
+    "Minimum: Safe from ground detuning. Moderate skip capability.",
+    "Regional: Good for local and statewide skip propagation.",
+    "Strong Mid-Range: Effective for continent-wide skip.",
+    "DX Sweet Spot: Maximum ground gain. Ideal for long distance.",
+    "Deep DX: Reaching other continents reliably.",
+    "Elite: Extremely low angle, massive skip distance.",
+    "Peak Performance: Point of diminishing returns.",
+    "Complex: Multiple radiation lobes may cause signal splitting.",
+)
+
+# Small-array F/B and F/S (dB) and bandwidth (%) by element count; larger arrays use the log2 fits
+_FB_FS_BY_N = {2: (14, 8), 3: (20, 12), 4: (24, 16), 5: (26, 18)}
+_BANDWIDTH_PCT_BY_N = (6, 6, 6, 6, 5, 5)
+
+# Efficiency loss ladders ("x > t" bands use bisect_left, "n >= t" / "x < t" bands bisect_right)
+_R_OHMIC_DIA_THRESHOLDS = (0.005, 0.01, 0.015, 0.02)
+_R_OHMIC_VALUES = (4.0, 2.5, 1.5, 1.0, 0.5)
+_R_GROUND_RADIAL_COUNTS = (8, 16, 32, 64)
+_R_GROUND_RADIAL_VALUES = (25.0, 15.0, 10.0, 5.0, 2.0)
+_R_GROUND_HEIGHT_THRESHOLDS = (0.25, 0.5, 1.0)
+_R_GROUND_HEIGHT_VALUES = (8.0, 3.0, 1.5, 0.5)
+_BOOM_EFFICIENCY_DIA_THRESHOLDS = (0.03, 0.05)
+_BOOM_EFFICIENCY_VALUES = (0.97, 0.98, 0.99)
+_SPACING_DEVIATION_THRESHOLDS = (0.1, 0.2, 0.3)
+_SPACING_EFFICIENCY_VALUES = (0.98, 0.97, 0.95, 0.92)
+
+
 def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
     band_info = BAND_DEFINITIONS.get(input_data.band, BAND_DEFINITIONS["11m_cb"])
     center_freq = input_data.frequency_mhz if input_data.frequency_mhz else band_info["center"]
     channel_spacing = band_info.get("channel_spacing_khz", 10) / 1000
     height_m = convert_height_to_meters(input_data.height_from_ground, input_data.height_unit)
     boom_dia_m = convert_boom_to_meters(input_data.boom_diameter, input_data.boom_unit)
-    c = 299792458
-    wavelength = c / (center_freq * 1e6)
+    wavelength = C_MPS / (center_freq * 1e6)
     n = input_data.num_elements
     height_wavelengths = height_m / wavelength
     taper_effects = calculate_taper_effects(input_data.taper, n)
     corona_effects = calculate_corona_effects(input_data.corona_balls)
     taper_enabled = input_data.taper.enabled if input_data.taper else False
-    avg_element_dia = sum(convert_element_to_meters(e.diameter, "inches") for e in input_data.elements) / len(input_data.elements)
+    # One pass over the elements: stage geometry (inches) for the array reductions below and
+    # classify them (first driven, first reflector, directors by position)
+    n_el = len(input_data.elements)
+    geometry = []
+    driven_el = refl_el = None
+    dir_els = []
+    for e in input_data.elements:
+        geometry.append((e.position, e.diameter, e.length))
+        el_type = e.element_type
+        if el_type == "driven":
+            if driven_el is None: driven_el = e
+        elif el_type == "reflector":
+            if refl_el is None: refl_el = e
+        elif el_type == "director":
+            dir_els.append(e)
+    dir_els.sort(key=lambda e: e.position)
+    positions_in, diameters_in, lengths_in = np.array(geometry, dtype=np.float64).reshape(-1, 3).T.copy()
+    sum_dia_m = sum((diameters_in * 0.0254).tolist())
+    sum_len_in = sum(lengths_in.tolist())
+    avg_element_dia = sum_dia_m / n_el
 
     # Boom correction
     boom_correction = calculate_boom_correction(boom_dia_m, avg_element_dia, wavelength, input_data.boom_grounded, input_data.boom_mount or ("bonded" if input_data.boom_grounded else "nonconductive"))
@@ -987,7 +1400,7 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
             corrected_elements.append({"type": el.element_type, "original_length": original_len, "corrected_length": corrected_len, "correction": round(correction_total, 3), "unit": "in"})
         boom_correction["corrected_elements"] = corrected_elements
 
-    has_reflector = any(e.element_type == "reflector" for e in input_data.elements)
+    has_reflector = refl_el is not None
     is_dual = input_data.antenna_orientation == "dual"
     dual_active = is_dual and input_data.dual_active
     dual_info = None
@@ -1005,10 +1418,10 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
             dual_info["combined_gain_bonus_db"] = 0
             dual_info["description"] = f"{n}H + {n}V = {n*2} total ({input_data.dual_selected_beam.upper()} selected)"
 
-    positions = sorted([e.position for e in input_data.elements])
-    boom_length_in = max(positions) - min(positions) if len(positions) > 1 else 48
+    boom_length_in = float(positions_in.max() - positions_in.min()) if n_el > 1 else 48
     boom_length_m = boom_length_in * 0.0254
     wavelength_in = wavelength / 0.0254
+    wavelength_ft = wavelength / 0.3048
     standard_gain = get_free_space_gain(effective_n)
     standard_boom_in = get_standard_boom_in(effective_n, wavelength_in)
 
@@ -1021,22 +1434,18 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
         boom_adj += dual_info["coupling_bonus_db"]
 
     gain_dbi = round(standard_gain + boom_adj, 2)
-    gain_breakdown = {"standard_gain": round(standard_gain, 2), "boom_adj": boom_adj}
 
     reflector_adj = 0
     if not has_reflector:
         reflector_adj = -1.5
         gain_dbi += reflector_adj
-    gain_breakdown["reflector_adj"] = round(reflector_adj, 2)
     base_gain_dbi = round(gain_dbi, 2)
 
     taper_bonus = taper_effects["gain_bonus"]
     gain_dbi += taper_bonus
-    gain_breakdown["taper_bonus"] = round(taper_bonus, 2)
 
     corona_adj = corona_effects.get("gain_effect", 0)
     gain_dbi += corona_adj
-    gain_breakdown["corona_adj"] = round(corona_adj, 2)
 
     ground_orient = "horizontal" if is_dual else input_data.antenna_orientation
     base_ground_gain = calculate_ground_gain(height_wavelengths, ground_orient)
@@ -1046,20 +1455,16 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
     ground_scale = 1.0
     if ground_radials and ground_radials.enabled:
         ground_type = ground_radials.ground_type
-        ground_type_scales = {"wet": 1.15, "average": 1.0, "dry": 0.70}
-        ground_scale = ground_type_scales.get(ground_type, 1.0)
+        ground_scale = _GROUND_TYPE_SCALES.get(ground_type, 1.0)
         # Radials improve ground plane quality but do NOT add antenna gain
 
     height_bonus = round(base_ground_gain * ground_scale, 2)
     gain_dbi += height_bonus
-    gain_breakdown["height_bonus"] = height_bonus
-    gain_breakdown["ground_type"] = ground_type
-    gain_breakdown["ground_scale"] = round(ground_scale, 2)
 
     boom_bonus = 0
     gain_dbi += boom_bonus
-    gain_breakdown["boom_bonus"] = round(boom_bonus, 2)
 
+    gain_breakdown = {"standard_gain": round(standard_gain, 2), "boom_adj": boom_adj, "reflector_adj": round(reflector_adj, 2), "taper_bonus": round(taper_bonus, 2), "corona_adj": round(corona_adj, 2), "height_bonus": height_bonus, "ground_type": ground_type, "ground_scale": round(ground_scale, 2), "boom_bonus": round(boom_bonus, 2)}
     if boom_correction["enabled"]:
         boom_grounded_adj = boom_correction["gain_adj_db"]
         gain_dbi += boom_grounded_adj
@@ -1083,12 +1488,6 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
     feed_type = input_data.feed_type
 
     # Feedpoint impedance via shared mutual coupling model
-    num_directors = len([e for e in input_data.elements if e.element_type == "director"])
-    has_reflector_for_z = any(e.element_type == "reflector" for e in input_data.elements)
-    driven_el = next((e for e in input_data.elements if e.element_type == "driven"), None)
-    refl_el = next((e for e in input_data.elements if e.element_type == "reflector"), None)
-    dir_els = sorted([e for e in input_data.elements if e.element_type == "director"], key=lambda e: e.position)
-
     refl_spacing_in = abs(driven_el.position - refl_el.position) if driven_el and refl_el else 48.0
     dir_spacings_in = [abs(d.position - driven_el.position) for d in dir_els] if driven_el and dir_els else None
     refl_length_in = refl_el.length if refl_el else 214.0
@@ -1102,7 +1501,7 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
 
     # Apply impedance mismatch to SWR
     impedance_swr = max(yagi_feedpoint_r / 50.0, 50.0 / yagi_feedpoint_r)
-    swr = round(max(1.0, min(swr * 0.3 + impedance_swr * 0.7, 10.0)), 2)
+    swr = round(_clamp(swr * 0.3 + impedance_swr * 0.7, 1.0, 10.0), 2)
 
     # Element resonant frequency via shared coupling model
     element_resonant_freq = center_freq
@@ -1150,7 +1549,7 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
     driven_dia_in = driven_el.diameter if driven_el else 0.5
 
     # Compute element diameter Q-factor (needed by matching network AND bandwidth)
-    avg_elem_dia_in = sum(e.diameter for e in input_data.elements) / n if n > 0 else 0.5
+    avg_elem_dia_in = sum(diameters_in.tolist()) / n if n > 0 else 0.5
     driven_len_in = driven_el.length if driven_el else 199.0
     dia_q_info = compute_diameter_q_factor(avg_elem_dia_in, driven_len_in, wavelength)
 
@@ -1195,23 +1594,22 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
                 "actual_hairpin_length_in": matching_info.get("actual_hairpin_length_in", 0),
                 "shorten_per_side_in": matching_info.get("shorten_per_side_in", 0),
                 "shortened_total_length_in": matching_info.get("shortened_total_length_in", 0),
-                "wavelength_inches": round(wavelength * 39.3701, 2),
+                "wavelength_inches": round(wavelength * M_TO_IN, 2),
             }
         elif "topology_note" in matching_info:
             matching_info["hairpin_design"] = {
                 "feedpoint_impedance_ohms": yagi_feedpoint_r,
                 "target_impedance_ohms": 50.0,
                 "topology_note": matching_info["topology_note"],
-                "wavelength_inches": round(wavelength * 39.3701, 2),
+                "wavelength_inches": round(wavelength * M_TO_IN, 2),
             }
 
     # Gamma match design calculations
     if feed_type == "gamma" and yagi_feedpoint_r < 50.0:
-        wavelength_in = wavelength * 39.3701
+        gamma_wavelength_in = wavelength * M_TO_IN
         step_up_ratio = round(math.sqrt(50.0 / yagi_feedpoint_r), 3)
         # Driven element diameter (get from actual element data)
-        driven_elem_calc = next((e for e in input_data.elements if e.element_type == "driven"), None)
-        element_dia = float(driven_elem_calc.diameter) if driven_elem_calc else 0.5
+        element_dia = float(driven_el.diameter) if driven_el else 0.5
         # Use actual hardware from matching calculation
         hw = matching_info.get("hardware", {})
         gamma_rod_dia = hw.get("rod_od", 0.500)
@@ -1222,9 +1620,9 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
         design_rod_od = gamma_rod_dia
         # Series capacitance: from actual coaxial geometry (rod insertion into tube)
         rod_insertion_design = input_data.gamma_element_gap if input_data.gamma_element_gap is not None else 11.0
-        rod_insertion_design = max(0, min(rod_insertion_design, design_tube_length))
+        rod_insertion_design = _clamp(rod_insertion_design, 0, design_tube_length)
         if rod_insertion_design > 0 and design_tube_id > design_rod_od:
-            design_cap_per_inch = 1.413 * 2.1 / math.log(design_tube_id / design_rod_od)
+            design_cap_per_inch = _gamma_cap_per_inch(design_tube_id, design_rod_od)
             design_auto_cap_pf = round(design_cap_per_inch * rod_insertion_design, 1)
         else:
             design_auto_cap_pf = 0
@@ -1245,37 +1643,31 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
             "auto_capacitance_pf": design_auto_cap_pf,
             "shorting_bar_position_in": shorting_bar_pos,
             "element_shortening_pct": 3.0,
-            "wavelength_inches": round(wavelength_in, 2),
+            "wavelength_inches": round(gamma_wavelength_in, 2),
         }
 
     if boom_correction["enabled"]:
         swr = round(swr * boom_correction["swr_factor"], 3)
-        swr = round(max(1.0, min(swr, 5.0)), 2)
+        swr = round(_clamp(swr, 1.0, 5.0), 2)
 
     # F/B and F/S
-    if n == 2: fb_ratio, fs_ratio = 14, 8
-    elif n == 3: fb_ratio, fs_ratio = 20, 12
-    elif n == 4: fb_ratio, fs_ratio = 24, 16
-    elif n == 5: fb_ratio, fs_ratio = 26, 18
+    if n in _FB_FS_BY_N:
+        fb_ratio, fs_ratio = _FB_FS_BY_N[n]
     else:
-        fb_ratio = 20 + 3.0 * math.log2(n - 2)
-        fs_ratio = 12 + 2.5 * math.log2(n - 2)
-
-    driven_elem = next((e for e in input_data.elements if e.element_type == "driven"), None)
-    reflector_elem = next((e for e in input_data.elements if e.element_type == "reflector"), None)
-    dir_elems = sorted([e for e in input_data.elements if e.element_type == "director"], key=lambda e: e.position)
+        n_octaves = math.log2(n - 2)
+        fb_ratio = 20 + 3.0 * n_octaves
+        fs_ratio = 12 + 2.5 * n_octaves
 
     spacing_gain_adj = 0.0
-    if driven_elem and reflector_elem and has_reflector and n >= 3:
-        refl_driven_spacing_m = abs(convert_element_to_meters(driven_elem.position - reflector_elem.position, "inches"))
+    if driven_el and refl_el and has_reflector and n >= 3:
+        refl_driven_spacing_m = abs((driven_el.position - refl_el.position) * 0.0254)
         refl_driven_lambda = refl_driven_spacing_m / wavelength if wavelength > 0 else 0.18
 
-        # Gain adjustment from driven-reflector spacing
+        # Gain adjustment from driven-reflector spacing (continuous V around the
+        # optimum, so written as two hinge terms instead of a branch)
         optimal_gain_lambda = 0.20
-        if refl_driven_lambda < optimal_gain_lambda:
-            spacing_gain_adj -= 2.5 * (optimal_gain_lambda - refl_driven_lambda) / 0.1
-        else:
-            spacing_gain_adj -= 1.5 * (refl_driven_lambda - optimal_gain_lambda) / 0.1
+        spacing_gain_adj -= (2.5 * max(0.0, optimal_gain_lambda - refl_driven_lambda)
+                             + 1.5 * max(0.0, refl_driven_lambda - optimal_gain_lambda)) / 0.1
 
         # F/B adjustment from driven-reflector spacing
         optimal_fb_lambda = 0.15
@@ -1285,11 +1677,11 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
             spacing_fb_adj = 2.0 - 4.0 * (refl_driven_lambda - optimal_fb_lambda) / 0.05
         else:
             spacing_fb_adj = -3.0 * (refl_driven_lambda - 0.20) / 0.1
-        spacing_fb_adj = round(max(-4.0, min(3.0, spacing_fb_adj)), 1)
+        spacing_fb_adj = round(_clamp(spacing_fb_adj, -4.0, 3.0), 1)
 
         # Director 1 spacing adjustments
-        if len(dir_elems) >= 1 and driven_elem:
-            dir1_spacing_m = abs(convert_element_to_meters(dir_elems[0].position - driven_elem.position, "inches"))
+        if len(dir_els) >= 1 and driven_el:
+            dir1_spacing_m = abs((dir_els[0].position - driven_el.position) * 0.0254)
             dir1_lambda = dir1_spacing_m / wavelength if wavelength > 0 else 0.13
             optimal_dir1 = 0.13
             dir1_dev = dir1_lambda - optimal_dir1
@@ -1301,15 +1693,12 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
                 spacing_gain_adj += 1.8 * dir1_dev / 0.05  # negative dev → negative gain adj
                 spacing_fb_adj += -1.5 * dir1_dev / 0.05   # closer = better F/B
             elif dir1_dev > 0.005:
-                # Farther — some gain initially, then drops; F/B degrades
-                if dir1_dev < 0.04:
-                    spacing_gain_adj += 0.6 * dir1_dev / 0.04  # slight gain boost
-                else:
-                    spacing_gain_adj += 0.6 - 1.5 * (dir1_dev - 0.04) / 0.05
+                # Farther — slight gain boost up to 0.04λ, then drops; F/B degrades
+                spacing_gain_adj += 0.6 * min(dir1_dev, 0.04) / 0.04 - 1.5 * max(0.0, dir1_dev - 0.04) / 0.05
                 spacing_fb_adj -= 1.2 * dir1_dev / 0.05
 
-        spacing_gain_adj = round(max(-2.5, min(1.0, spacing_gain_adj)), 2)
-        spacing_fb_adj = round(max(-4.0, min(3.0, spacing_fb_adj)), 1)
+        spacing_gain_adj = round(_clamp(spacing_gain_adj, -2.5, 1.0), 2)
+        spacing_fb_adj = round(_clamp(spacing_fb_adj, -4.0, 3.0), 1)
         fb_ratio += spacing_fb_adj
         fs_ratio += spacing_fb_adj * 0.5
         gain_dbi += spacing_gain_adj
@@ -1330,10 +1719,10 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
 
     # Beamwidth
     boom_length_m = boom_length_in * 0.0254
-    g_free_linear = 10 ** (base_gain_dbi / 10) if base_gain_dbi > 0 else 1
-    avg_el_len_m = sum(e.length for e in input_data.elements) / n * 0.0254 if n > 0 else wavelength * 0.48
+    g_free_linear = math.exp(base_gain_dbi * _LN10_OVER_10) if base_gain_dbi > 0 else 1
+    avg_el_len_m = sum_len_in / n * 0.0254 if n > 0 else wavelength * 0.48
     aspect = boom_length_m / avg_el_len_m if avg_el_len_m > 0 else 1.5
-    aspect = max(0.5, min(aspect, 5.0))
+    aspect = _clamp(aspect, 0.5, 5.0)
     if g_free_linear > 1:
         beamwidth_h = math.sqrt(32400.0 / (g_free_linear * aspect))
         beamwidth_v = math.sqrt(32400.0 * aspect / g_free_linear)
@@ -1346,9 +1735,7 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
     # dia_q_info already computed before apply_matching_network
 
     # Bandwidth — Q-factor model based on element diameter
-    if n <= 3: bandwidth_percent = 6
-    elif n <= 5: bandwidth_percent = 5
-    else: bandwidth_percent = 5 / (1 + 0.04 * (n - 5))
+    bandwidth_percent = _BANDWIDTH_PCT_BY_N[n] if n <= 5 else 5 / (1 + 0.04 * (n - 5))
     bandwidth_percent *= taper_effects["bandwidth_mult"]
     bandwidth_percent *= corona_effects.get("bandwidth_effect", 1.0)
     # Apply diameter-based Q-factor bandwidth multiplier
@@ -1372,48 +1759,31 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
         fb_ratio = round(fb_ratio + 0.5, 1)
         bandwidth_mhz = round(bandwidth_mhz * 1.05, 3)  # hairpin is broadband
 
-    multiplication_factor = round(10 ** (gain_dbi / 10), 2)
+    gain_linear = math.exp(gain_dbi * _LN10_OVER_10)
+    multiplication_factor = round(gain_linear, 2)
 
     # Efficiency
     antenna_orient = input_data.antenna_orientation
     r_rad = 73.0 if antenna_orient == "horizontal" else (36.5 if antenna_orient == "vertical" else 55.0)
-    avg_element_dia_m = sum(convert_element_to_meters(e.diameter, "inches") for e in input_data.elements) / n
-    if avg_element_dia_m > 0.02: r_ohmic = 0.5
-    elif avg_element_dia_m > 0.015: r_ohmic = 1.0
-    elif avg_element_dia_m > 0.01: r_ohmic = 1.5
-    elif avg_element_dia_m > 0.005: r_ohmic = 2.5
-    else: r_ohmic = 4.0
+    avg_element_dia_m = sum_dia_m / n
+    r_ohmic = _R_OHMIC_VALUES[bisect_left(_R_OHMIC_DIA_THRESHOLDS, avg_element_dia_m)]
     if antenna_orient == "vertical":
         if ground_radials and ground_radials.enabled:
-            num_r = ground_radials.num_radials
-            if num_r >= 64: r_ground = 2.0
-            elif num_r >= 32: r_ground = 5.0
-            elif num_r >= 16: r_ground = 10.0
-            elif num_r >= 8: r_ground = 15.0
-            else: r_ground = 25.0
+            r_ground = _R_GROUND_RADIAL_VALUES[bisect_right(_R_GROUND_RADIAL_COUNTS, ground_radials.num_radials)]
         else: r_ground = 36.0
     else:
-        if height_wavelengths < 0.25: r_ground = 8.0
-        elif height_wavelengths < 0.5: r_ground = 3.0
-        elif height_wavelengths < 1.0: r_ground = 1.5
-        else: r_ground = 0.5
+        r_ground = _R_GROUND_HEIGHT_VALUES[bisect_right(_R_GROUND_HEIGHT_THRESHOLDS, height_wavelengths)]
     r_loss = r_ohmic + r_ground
     radiation_efficiency = r_rad / (r_rad + r_loss)
     swr_reflection_coeff = (swr - 1) / (swr + 1)
-    swr_mismatch_loss = 1 - (swr_reflection_coeff ** 2)
-    if boom_dia_m > 0.05: boom_efficiency = 0.99
-    elif boom_dia_m > 0.03: boom_efficiency = 0.98
-    else: boom_efficiency = 0.97
-    driven_elem = next((e for e in input_data.elements if e.element_type == "driven"), None)
-    reflector_elem = next((e for e in input_data.elements if e.element_type == "reflector"), None)
+    swr_mismatch_loss = 1 - swr_reflection_coeff * swr_reflection_coeff
+    boom_efficiency = _BOOM_EFFICIENCY_VALUES[bisect_left(_BOOM_EFFICIENCY_DIA_THRESHOLDS, boom_dia_m)]
     spacing_efficiency = 0.98
-    if driven_elem and reflector_elem:
-        spacing_m = abs(convert_element_to_meters(driven_elem.position - reflector_elem.position, "inches"))
+    if driven_el and refl_el:
+        spacing_m = abs((driven_el.position - refl_el.position) * 0.0254)
         ideal_spacing = wavelength * 0.2
         spacing_deviation = abs(spacing_m - ideal_spacing) / ideal_spacing
-        if spacing_deviation > 0.3: spacing_efficiency = 0.92
-        elif spacing_deviation > 0.2: spacing_efficiency = 0.95
-        elif spacing_deviation > 0.1: spacing_efficiency = 0.97
+        spacing_efficiency = _SPACING_EFFICIENCY_VALUES[bisect_left(_SPACING_DEVIATION_THRESHOLDS, spacing_deviation)]
     taper_efficiency = 1.02 if taper_enabled else 1.0
     # Feed type efficiency: gamma rod has resistive loss, hairpin is very low loss
     feed_efficiency = 0.97 if feed_type == "gamma" else (0.995 if feed_type == "hairpin" else 1.0)
@@ -1442,8 +1812,8 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
         element_count_q_mult = 1.4 + 0.15 * (n - 5)
     
     # Spacing effect: tighter spacing = higher mutual coupling = higher Q
-    if driven_elem and reflector_elem:
-        spacing_wl = abs(convert_element_to_meters(driven_elem.position - reflector_elem.position, "inches")) / wavelength
+    if driven_el and refl_el:
+        spacing_wl = abs((driven_el.position - refl_el.position) * 0.0254) / wavelength
         if spacing_wl < 0.12:
             spacing_q_mult = 1.5  # very tight — high Q, sharp curve
         elif spacing_wl < 0.18:
@@ -1464,8 +1834,8 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
         gamma_bar = matching_info.get("bar_position_inches", 13.0)
         gamma_cap = matching_info.get("insertion_cap_pf", 50.0)
         # Longer bar position relative to driven element = higher circuit Q
-        if driven_elem:
-            bar_fraction = gamma_bar / max(driven_elem.length / 2, 1.0)
+        if driven_el:
+            bar_fraction = gamma_bar / max(driven_el.length / 2, 1.0)
             # bar_fraction near 0.15 = typical, near 0.3+ = high Q
             matching_q_mult = 1.0 + max(0, bar_fraction - 0.12) * 3.0
         # Very small cap values = high reactance = sharp tuning
@@ -1478,7 +1848,7 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
     
     antenna_q = base_q * element_count_q_mult * spacing_q_mult * matching_q_mult
     # Clamp to physically realistic range: 5 (very wideband) to 60 (very sharp)
-    antenna_q = max(5.0, min(60.0, antenna_q))
+    antenna_q = _clamp(antenna_q, 5.0, 60.0)
 
     if feed_type == "gamma" and matching_info and "z_matched_r" in matching_info:
         # Physics-based impedance from unified gamma match model
@@ -1503,9 +1873,11 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
 
     # Complex reflection coefficient: Γ = (Z_ant - Z_0) / (Z_ant + Z_0)
     # Z_ant = z_r + j*z_x, Z_0 = 50 (real)
-    gamma_real = ((z_r - z_0) * (z_r + z_0) + z_x * z_x) / ((z_r + z_0) ** 2 + z_x ** 2)
-    gamma_imag = (2 * z_x * z_0) / ((z_r + z_0) ** 2 + z_x ** 2)  # note: sign doesn't matter for magnitude
-    reflection_coefficient = round(math.sqrt(gamma_real ** 2 + gamma_imag ** 2), 8)
+    z_sum = z_r + z_0
+    gamma_denom = z_sum * z_sum + z_x * z_x
+    gamma_real = ((z_r - z_0) * z_sum + z_x * z_x) / gamma_denom
+    gamma_imag = (2 * z_x * z_0) / gamma_denom  # note: sign doesn't matter for magnitude
+    reflection_coefficient = round(math.hypot(gamma_real, gamma_imag), 8)
     reflection_coefficient = min(reflection_coefficient, 0.999)  # clamp
 
     if reflection_coefficient > 1e-6:
@@ -1517,48 +1889,37 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
     swr_from_gamma = (1 + reflection_coefficient) / (1 - reflection_coefficient) if reflection_coefficient < 1.0 else 99.0
     # SWR must be derived from reflection coefficient for consistency
     swr = round(max(1.0, swr_from_gamma), 2)
-    mismatch_loss = 1 - (reflection_coefficient ** 2)
+    rho_sq = reflection_coefficient * reflection_coefficient
+    mismatch_loss = 1 - rho_sq
     mismatch_loss_db = round(-10 * math.log10(mismatch_loss), 3) if mismatch_loss > 0 else 0
-    reflected_power_100w = round(100 * (reflection_coefficient ** 2), 2)
-    reflected_power_1kw = round(1000 * (reflection_coefficient ** 2), 1)
+    reflected_power_100w = round(100 * rho_sq, 2)
+    reflected_power_1kw = round(1000 * rho_sq, 1)
     forward_power_100w = round(100 - reflected_power_100w, 2)
     forward_power_1kw = round(1000 - reflected_power_1kw, 1)
     impedance_high = round(50 * swr, 1)
     impedance_low = round(50 / swr, 1)
 
     # Coax feedline loss calculation
-    coax_loss_table = {
-        "ldf550a": {"name": "LDF5-50A 7/8\" Heliax", "loss_per_100ft": 0.22, "power_rating_watts": 14000, "velocity_factor": 0.89},
-        "ldf450a": {"name": "LDF4-50A 1/2\" Heliax", "loss_per_100ft": 0.41, "power_rating_watts": 4800, "velocity_factor": 0.88},
-        "rg213": {"name": "RG-213/U", "loss_per_100ft": 1.0, "power_rating_watts": 1000, "velocity_factor": 0.66},
-        "rg213u": {"name": "RG-213/U", "loss_per_100ft": 1.0, "power_rating_watts": 1000, "velocity_factor": 0.66},
-        "rg8": {"name": "RG-8/U", "loss_per_100ft": 1.0, "power_rating_watts": 1000, "velocity_factor": 0.66},
-        "rg8u": {"name": "RG-8/U", "loss_per_100ft": 1.0, "power_rating_watts": 1000, "velocity_factor": 0.66},
-        "rg8x": {"name": "RG-8X Mini-8", "loss_per_100ft": 1.6, "power_rating_watts": 300, "velocity_factor": 0.78},
-        "rg8xmini8": {"name": "RG-8X Mini-8", "loss_per_100ft": 1.6, "power_rating_watts": 300, "velocity_factor": 0.78},
-        "rg58": {"name": "RG-58/U", "loss_per_100ft": 2.4, "power_rating_watts": 200, "velocity_factor": 0.66},
-        "rg58u": {"name": "RG-58/U", "loss_per_100ft": 2.4, "power_rating_watts": 200, "velocity_factor": 0.66},
-    }
-    coax_type = getattr(input_data, 'coax_type', 'ldf5-50a').lower().replace('-', '').replace('/', '').replace(' ', '')
+    coax_type = getattr(input_data, 'coax_type', 'ldf5-50a').lower().translate(_COAX_KEY_STRIP)
     coax_length_ft = getattr(input_data, 'coax_length_ft', 100.0)
     transmit_power = getattr(input_data, 'transmit_power_watts', 500.0)
-    coax_spec = coax_loss_table.get(coax_type, coax_loss_table["ldf550a"])
-    coax_loss_db = round(coax_spec["loss_per_100ft"] * coax_length_ft / 100.0, 2)
+    coax_name, coax_loss_per_100ft, coax_power_rating, coax_vf = _COAX_LOSS_TABLE.get(coax_type, _COAX_LOSS_TABLE["ldf550a"])
+    coax_loss_db = round(coax_loss_per_100ft * coax_length_ft / 100.0, 2)
     # Additional loss from SWR (standing waves increase cable heating)
     swr_loss_multiplier = 1.0 + (swr - 1.0) * 0.05 if swr > 1.0 else 1.0
     total_coax_loss_db = round(coax_loss_db * swr_loss_multiplier, 2)
-    coax_loss_ratio = 10 ** (-total_coax_loss_db / 10)
+    coax_loss_ratio = math.exp(-total_coax_loss_db * _LN10_OVER_10)
     power_at_antenna = round(transmit_power * coax_loss_ratio, 1)
-    reflected_power_watts = round(power_at_antenna * (reflection_coefficient ** 2), 2)
+    reflected_power_watts = round(power_at_antenna * rho_sq, 2)
     forward_power_watts = round(power_at_antenna - reflected_power_watts, 2)
     coax_info = {
-        "type": coax_spec["name"],
+        "type": coax_name,
         "length_ft": coax_length_ft,
         "matched_loss_db": coax_loss_db,
         "total_loss_db": total_coax_loss_db,
         "swr_loss_multiplier": round(swr_loss_multiplier, 3),
-        "power_rating_watts": coax_spec["power_rating_watts"],
-        "velocity_factor": coax_spec["velocity_factor"],
+        "power_rating_watts": coax_power_rating,
+        "velocity_factor": coax_vf,
         "transmit_power_watts": transmit_power,
     }
 
@@ -1567,12 +1928,7 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
     ground_type = "average"
     if ground_radials and ground_radials.enabled:
         ground_type = ground_radials.ground_type
-    ground_factors = {
-        "wet": {"conductivity": 0.03, "permittivity": 30, "reflection": 0.95, "angle_adj": -3},
-        "average": {"conductivity": 0.005, "permittivity": 13, "reflection": 0.85, "angle_adj": 0},
-        "dry": {"conductivity": 0.001, "permittivity": 5, "reflection": 0.70, "angle_adj": 5}
-    }
-    ground = ground_factors.get(ground_type, ground_factors["average"])
+    ground_conductivity, ground_permittivity, ground_reflection, ground_angle_adj = _GROUND_FACTORS.get(ground_type, _GROUND_FACTORS["average"])
     antenna_orient = input_data.antenna_orientation
     if antenna_orient == "vertical":
         base_takeoff = 15.0
@@ -1593,45 +1949,25 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
     elif height_wavelengths >= 0.25:
         base_takeoff = math.degrees(math.asin(min(1.0, 1 / (4 * height_wavelengths))))
     else: base_takeoff = 70 + (0.25 - height_wavelengths) * 80
-    takeoff_angle = round(max(5, min(90, base_takeoff + ground["angle_adj"])), 1)
-
-    if takeoff_angle < 10: takeoff_desc = "Elite (Extremely low angle, massive DX)"
-    elif takeoff_angle < 15: takeoff_desc = "Deep DX (Reaching other continents)"
-    elif takeoff_angle < 18: takeoff_desc = "DX Sweet Spot (Maximum ground gain)"
-    elif takeoff_angle < 22: takeoff_desc = "Strong Mid-Range (Continent-wide skip)"
-    elif takeoff_angle < 28: takeoff_desc = "Regional (Good local/statewide skip)"
-    elif takeoff_angle < 35: takeoff_desc = "Minimum (Moderate skip, safe from detuning)"
-    elif takeoff_angle < 50: takeoff_desc = "Medium (Regional/DX mix)"
-    elif takeoff_angle < 70: takeoff_desc = "High (Near vertical, short distance)"
-    else: takeoff_desc = "Inefficient (High ground absorption)"
-
-    if height_wavelengths < 0.25: height_perf = "Inefficient: Below minimum height. Ground absorption detunes elements."
-    elif height_wavelengths < 0.40: height_perf = "Near Vertical: High-angle signal, very short distance only."
-    elif height_wavelengths < 0.55: height_perf = "Minimum: Safe from ground detuning. Moderate skip capability."
-    elif height_wavelengths < 0.70: height_perf = "Regional: Good for local and statewide skip propagation."
-    elif height_wavelengths < 0.85: height_perf = "Strong Mid-Range: Effective for continent-wide skip."
-    elif height_wavelengths < 1.05: height_perf = "DX Sweet Spot: Maximum ground gain. Ideal for long distance."
-    elif height_wavelengths < 1.25: height_perf = "Deep DX: Reaching other continents reliably."
-    elif height_wavelengths < 1.75: height_perf = "Elite: Extremely low angle, massive skip distance."
-    elif height_wavelengths < 2.5: height_perf = "Peak Performance: Point of diminishing returns."
-    else: height_perf = "Complex: Multiple radiation lobes may cause signal splitting."
+    takeoff_angle = round(_clamp(base_takeoff + ground_angle_adj, 5, 90), 1)
+
+    takeoff_desc = _TAKEOFF_LABELS[bisect_right(_TAKEOFF_THRESHOLDS, takeoff_angle)]
+    height_perf = _HEIGHT_PERF_LABELS[bisect_right(_HEIGHT_PERF_THRESHOLDS, height_wavelengths)]
 
     # Ground radials info
     ground_radials_info = None
     if ground_radials and ground_radials.enabled:
         quarter_wave_m = wavelength / 4
         quarter_wave_ft = quarter_wave_m * 3.28084
-        quarter_wave_in = quarter_wave_m * 39.3701
-        all_directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW", "NNE", "ENE", "ESE", "SSE", "SSW", "WSW", "WNW", "NNW", "N2", "E2"]
+        quarter_wave_in = quarter_wave_m * M_TO_IN
         num_rads = ground_radials.num_radials
-        radial_directions = all_directions[:num_rads]
+        radial_directions = list(_RADIAL_DIRECTIONS[:num_rads])
         radial_factor = num_rads / 8.0
-        ground_improvement = {"wet": {"swr_improvement": 0.05, "efficiency_bonus": 8}, "average": {"swr_improvement": 0.03, "efficiency_bonus": 5}, "dry": {"swr_improvement": 0.01, "efficiency_bonus": 2}}
-        base_bonus = ground_improvement.get(ground_type, ground_improvement["average"])
+        base_swr_imp, base_eff_bonus = _GROUND_RADIAL_IMPROVEMENT.get(ground_type, _GROUND_RADIAL_IMPROVEMENT["average"])
         if radial_factor <= 1.0: scale = radial_factor
         else: scale = 1.0 + (math.log2(radial_factor) * 0.5)
-        g_bonus = {"swr_improvement": round(base_bonus["swr_improvement"] * scale, 3), "efficiency_bonus": round(base_bonus["efficiency_bonus"] * scale, 1)}
-        ground_radials_info = {"enabled": True, "ground_type": ground_type, "ground_conductivity": ground["conductivity"], "ground_permittivity": ground["permittivity"], "ground_reflection_coeff": ground["reflection"], "radial_length_m": round(quarter_wave_m, 2), "radial_length_ft": round(quarter_wave_ft, 2), "radial_length_in": round(quarter_wave_in, 1), "wire_diameter_in": ground_radials.wire_diameter, "num_radials": ground_radials.num_radials, "radial_directions": radial_directions, "total_wire_length_ft": round(quarter_wave_ft * ground_radials.num_radials, 1), "estimated_improvements": {"swr_improvement": g_bonus["swr_improvement"], "efficiency_bonus_percent": g_bonus["efficiency_bonus"]}}
+        g_bonus = {"swr_improvement": round(base_swr_imp * scale, 3), "efficiency_bonus": round(base_eff_bonus * scale, 1)}
+        ground_radials_info = {"enabled": True, "ground_type": ground_type, "ground_conductivity": ground_conductivity, "ground_permittivity": ground_permittivity, "ground_reflection_coeff": ground_reflection, "radial_length_m": round(quarter_wave_m, 2), "radial_length_ft": round(quarter_wave_ft, 2), "radial_length_in": round(quarter_wave_in, 1), "wire_diameter_in": ground_radials.wire_diameter, "num_radials": ground_radials.num_radials, "radial_directions": radial_directions, "total_wire_length_ft": round(quarter_wave_ft * ground_radials.num_radials, 1), "estimated_improvements": {"swr_improvement": g_bonus["swr_improvement"], "efficiency_bonus_percent": g_bonus["efficiency_bonus"]}}
         swr = swr  # radials improve efficiency, NOT impedance match
         gain_breakdown["final_gain"] = gain_dbi
         antenna_efficiency = min(200.0, antenna_efficiency + g_bonus["efficiency_bonus"])
@@ -1649,146 +1985,120 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
     if swr_span and swr_span > 0:
         half_span = swr_span / 2.0
         # Generate 201 points across the span for smooth, high-res curve
-        num_points = 201
-        sweep_step = swr_span / (num_points - 1)
-        sweep_freqs = [(center_freq - half_span + i * sweep_step, i - num_points // 2) for i in range(num_points)]
+        sweep_step = swr_span / (_SPAN_POINTS - 1)
+        sweep_arr = (center_freq - half_span) + _SPAN_OFFSETS * sweep_step
+        sweep_channels = _SPAN_INDEX
     else:
-        sweep_freqs = [(center_freq + i * channel_spacing, i) for i in range(-30, 31)]
+        sweep_arr = center_freq + _CHANNEL_OFFSETS * channel_spacing
+        sweep_channels = _CHANNEL_INDEX
     
-    smith_chart_data = []
-    for freq, ch_idx in sweep_freqs:
-        sc_r = yagi_feedpoint_r
-        if smith_res_freq > 0:
-            fr = freq / smith_res_freq
-            sc_x = smith_q * yagi_feedpoint_r * (fr - 1.0 / fr)
-        else:
-            sc_x = 0.0
-        if feed_type == "gamma" and matching_info and "tuning_quality" in matching_info:
-            step_up = matching_info.get("step_up_ratio", math.sqrt(50.0 / max(yagi_feedpoint_r, 5.0)))
-            if isinstance(step_up, str):
-                try: step_up = float(str(step_up).replace(':1',''))
-                except: step_up = math.sqrt(50.0 / max(yagi_feedpoint_r, 5.0))
-            k_sq = step_up ** 2
-            bar_pos_in = matching_info.get("bar_position_inches", 13.0)
-            cap_pf = matching_info.get("cap_pf_used", matching_info.get("insertion_cap_pf", 50.0))
-            # Use pre-computed z0_gamma from apply_matching_network (actual hardware)
-            z0_g = matching_info.get("z0_gamma", 300.0)
-            freq_hz = freq * 1e6
-            wavelength_m = 299792458.0 / freq_hz
-            bar_pos_m = bar_pos_in * 0.0254
-            beta_l = 2.0 * math.pi * bar_pos_m / wavelength_m
-            x_stub = z0_g * math.tan(beta_l)
-            omega_f = 2.0 * math.pi * freq_hz
-            x_cap = -1.0 / (omega_f * (cap_pf * 1e-12)) if cap_pf > 0 else 0
-            sc_r = sc_r * k_sq
-            sc_x = (sc_x * step_up) + x_stub + x_cap
-        elif feed_type == "hairpin" and matching_info and "tuning_quality" in matching_info:
-            tq = matching_info["tuning_quality"]
-            sc_x *= 0.10
-            residual = (1.0 - tq) * 0.25
-            sc_r = 50.0 * (1.0 + residual)
-        denom_r = (sc_r + z_0) ** 2 + sc_x ** 2
-        g_re = ((sc_r - z_0) * (sc_r + z_0) + sc_x ** 2) / denom_r if denom_r > 0 else 0
-        g_im = (2 * sc_x * z_0) / denom_r if denom_r > 0 else 0
-        omega = 2 * math.pi * freq * 1e6
-        inductance_nh = round(sc_x / omega * 1e9, 2) if sc_x > 0 and omega > 0 else 0
-        capacitance_pf_val = round(-1e12 / (omega * sc_x), 2) if sc_x < -0.5 and omega > 0 else 0
-        if capacitance_pf_val > 1000:
-            capacitance_pf_val = 0  # near-resonance artifact — not a real component value
-        smith_chart_data.append({
-            "freq": round(freq, 4),
-            "z_real": round(sc_r, 2),
-            "z_imag": round(sc_x, 2),
-            "gamma_real": round(g_re, 5),
-            "gamma_imag": round(g_im, 5),
-            "inductance_nh": inductance_nh,
-            "capacitance_pf": capacitance_pf_val,
-        })
+    feed_mode = 0
+    step_up = 1.0
+    bar_pos_in = 13.0
+    cap_pf = 0.0
+    z0_g = 300.0
+    tq = 1.0
+    if feed_type == "gamma" and matching_info and "tuning_quality" in matching_info:
+        feed_mode = 1
+        step_up = matching_info.get("step_up_ratio", math.sqrt(50.0 / max(yagi_feedpoint_r, 5.0)))
+        if isinstance(step_up, str):
+            try: step_up = float(str(step_up).replace(':1',''))
+            except: step_up = math.sqrt(50.0 / max(yagi_feedpoint_r, 5.0))
+        bar_pos_in = matching_info.get("bar_position_inches", 13.0)
+        cap_pf = matching_info.get("cap_pf_used", matching_info.get("insertion_cap_pf", 50.0))
+        # Use pre-computed z0_gamma from apply_matching_network (actual hardware)
+        z0_g = matching_info.get("z0_gamma", 300.0)
+    elif feed_type == "hairpin" and matching_info and "tuning_quality" in matching_info:
+        feed_mode = 2
+        tq = matching_info["tuning_quality"]
+    sc_r_arr, sc_x_arr, g_re_arr, g_im_arr, omega_arr = _smith_sweep_kernel(
+        sweep_arr, smith_res_freq, smith_q, yagi_feedpoint_r, z_0,
+        feed_mode, step_up, bar_pos_in, cap_pf, z0_g, tq)
+
+    # Round each column once; the row-form payload the frontend expects is
+    # zipped from the columns in a single pass
+    freq_col = [round(f, 4) for f in sweep_arr.tolist()]
+    z_real_col = [round(v, 2) for v in sc_r_arr.tolist()]
+    z_imag_col = [round(v, 2) for v in sc_x_arr.tolist()]
+    g_re_col = [round(v, 5) for v in g_re_arr.tolist()]
+    g_im_col = [round(v, 5) for v in g_im_arr.tolist()]
+    # Equivalent series L at inductive points, C at capacitive ones
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ind_mask = (sc_x_arr > 0) & (omega_arr > 0)
+        cap_mask = (sc_x_arr < -0.5) & (omega_arr > 0)
+        ind_arr = sc_x_arr / omega_arr * 1e9
+        cap_arr = -1e12 / (omega_arr * sc_x_arr)
+    ind_col = [round(v, 2) if m else 0 for v, m in zip(ind_arr.tolist(), ind_mask.tolist())]
+    cap_col = []
+    for v, m in zip(cap_arr.tolist(), cap_mask.tolist()):
+        c_pf = round(v, 2) if m else 0
+        cap_col.append(c_pf if c_pf <= 1000 else 0)  # near-resonance artifact — not a real component value
+    smith_chart_data = [
+        {"freq": f, "z_real": r, "z_imag": x, "gamma_real": g_re, "gamma_imag": g_im,
+         "inductance_nh": l_nh, "capacitance_pf": c_pf}
+        for f, r, x, g_re, g_im, l_nh, c_pf in zip(freq_col, z_real_col, z_imag_col, g_re_col, g_im_col, ind_col, cap_col)
+    ]
 
     # SWR curve — derived from Smith Chart full-physics impedance data
-    swr_curve = []
-    for idx, sc_pt in enumerate(smith_chart_data):
-        g_mag = math.sqrt(sc_pt["gamma_real"] ** 2 + sc_pt["gamma_imag"] ** 2)
-        g_mag = min(g_mag, 0.999)
-        sc_swr = (1 + g_mag) / (1 - g_mag) if g_mag < 1.0 else 99.0
-        sc_swr = round(max(1.0, min(sc_swr, 10.0)), 2)
-        swr_curve.append({"frequency": sc_pt["freq"], "swr": sc_swr, "channel": sweep_freqs[idx][1]})
+    # (vectorized over the sweep; |Γ| is capped at 0.999 so SWR never diverges)
+    sc_g_re = np.array(g_re_col, dtype=np.float64)
+    sc_g_im = np.array(g_im_col, dtype=np.float64)
+    g_mag_arr = np.minimum(np.sqrt(sc_g_re * sc_g_re + sc_g_im * sc_g_im), 0.999)
+    sc_swr_arr = np.clip((1.0 + g_mag_arr) / (1.0 - g_mag_arr), 1.0, 10.0)
+    sc_swr_vals = [round(s, 2) for s in sc_swr_arr.tolist()]
+    swr_curve = [
+        {"frequency": f, "swr": sc_swr, "channel": ch}
+        for f, sc_swr, ch in zip(freq_col, sc_swr_vals, sweep_channels)
+    ]
     # Calculate usable bandwidth using actual frequency step between adjacent points
-    freq_step = abs(sweep_freqs[1][0] - sweep_freqs[0][0]) if len(sweep_freqs) > 1 else channel_spacing
-    usable_1_5 = round(sum(1 for p in swr_curve if p["swr"] <= 1.5) * freq_step, 3)
-    usable_2_0 = round(sum(1 for p in swr_curve if p["swr"] <= 2.0) * freq_step, 3)
+    freq_step = abs(float(sweep_arr[1] - sweep_arr[0])) if len(sweep_arr) > 1 else channel_spacing
+    sc_swr_rounded = np.array(sc_swr_vals, dtype=np.float64)
+    usable_1_5 = round(int(np.count_nonzero(sc_swr_rounded <= 1.5)) * freq_step, 3)
+    usable_2_0 = round(int(np.count_nonzero(sc_swr_rounded <= 2.0)) * freq_step, 3)
 
     # Derive gamma-tuned resonant frequency from actual SWR curve minimum
     if swr_curve:
-        min_swr_pt = min(swr_curve, key=lambda p: p["swr"])
-        curve_resonant_freq = min_swr_pt["frequency"]
+        curve_resonant_freq = swr_curve[int(np.argmin(sc_swr_rounded))]["frequency"]
     else:
         curve_resonant_freq = center_freq
 
     # Far field pattern
-    far_field_pattern = []
-    for angle in range(0, 361, 5):
-        theta = math.radians(angle)
-        cos_theta = math.cos(theta)
-        if not has_reflector:
-            if n == 2:
-                main_lobe = 0.6 + 0.4 * cos_theta
-                magnitude = (max(0.2, main_lobe) ** 1.5) * 100
-            else:
-                forward_gain = max(0, cos_theta) ** 1.5 if cos_theta >= 0 else 0
-                back_level = 0.3 + 0.1 * min(n - 2, 5)
-                if 90 < angle < 270: magnitude = max(forward_gain, back_level) * 100
-                else: magnitude = max(forward_gain, 0.1) * 100
-                if 60 < angle < 120 or 240 < angle < 300: magnitude = max(magnitude, 25)
-        else:
-            if n == 2:
-                main_lobe = (cos_theta + 0.3) / 1.3
-                magnitude = (max(0, main_lobe) ** 2) * 100
-            else:
-                main_lobe = max(0, cos_theta ** 2)
-                back_attenuation = 10 ** (-fb_ratio / 20)
-                side_attenuation = 10 ** (-fs_ratio / 20)
-                if 90 < angle < 270: magnitude = main_lobe * back_attenuation * 100
-                else: magnitude = main_lobe * 100
-                if 60 < angle < 120 or 240 < angle < 300: magnitude *= side_attenuation
-        far_field_pattern.append({"angle": angle, "magnitude": round(max(magnitude, 1), 1)})
+    back_attenuation = math.exp(-fb_ratio * _LN10_OVER_20)
+    side_attenuation = math.exp(-fs_ratio * _LN10_OVER_20)
+    far_mag, side_floored = _far_field_kernel(n, has_reflector, back_attenuation, side_attenuation)
+    far_field_pattern = [
+        {"angle": angle, "magnitude": round(max(magnitude, 1), 1)}
+        for angle, magnitude in zip(_FAR_ANGLES, far_mag.tolist())
+    ]
+    for i in side_floored:
+        far_field_pattern[i]["magnitude"] = 25
 
     # Elevation pattern — full vertical plane showing all lobes, front AND back
     # Ground reflection creates multiple lobes: E(θ) = sin(2π·h·sin(θ)/λ)
     height_m = convert_height_to_meters(input_data.height_from_ground, input_data.height_unit)
     height_wl = height_m / wavelength if wavelength > 0 else 1.0
-    elevation_pattern = []
-    for angle in range(0, 361, 2):  # 0°=right(horizon), 90°=up, 180°=left(back horizon), 270°=down
-        theta = math.radians(angle)
-        if angle <= 180:
-            # Front hemisphere: 0°=horizon, 90°=zenith, 180°=back horizon
-            elev = angle  # elevation from front horizon
-            if elev <= 90:
-                # Front upper: main beam side
-                elev_rad = math.radians(elev)
-                # Ground reflection factor creates lobes
-                ground_factor = abs(math.sin(2 * math.pi * height_wl * math.sin(elev_rad))) if height_wl > 0 else 1.0
-                # Element pattern: Yagi forward gain tapers off at high elevations
-                element_factor = max(0.05, math.cos(elev_rad * 0.7) ** 1.5)
-                magnitude = ground_factor * element_factor * 100
-            else:
-                # Back upper: behind antenna, above horizon
-                back_elev = 180 - elev  # angle above back horizon
-                back_elev_rad = math.radians(back_elev)
-                ground_factor = abs(math.sin(2 * math.pi * height_wl * math.sin(back_elev_rad))) if height_wl > 0 else 1.0
-                # Back attenuation from F/B ratio
-                back_atten = 10 ** (-fb_ratio / 20)
-                element_factor = max(0.05, math.cos(back_elev_rad * 0.7) ** 1.5) * back_atten
-                magnitude = ground_factor * element_factor * 100
-        else:
-            # Below ground plane (mirror/null) — show as minimal
-            magnitude = 1.0
-        elevation_pattern.append({"angle": angle, "magnitude": round(max(magnitude, 1), 1)})
+    two_pi_h = TWO_PI * height_wl
+    # 0°=right(horizon), 90°=up, 180°=left(back horizon), 270°=down; the lower
+    # half-plane (mirror/null) is shown as minimal
+    if height_wl > 0:
+        # Ground reflection factor creates lobes
+        ground_factor = np.abs(np.sin(two_pi_h * _ELEV_SIN_FRONT))
+    else:
+        ground_factor = np.ones_like(_ELEV_SIN_FRONT)
+    # Back upper half is attenuated by the F/B ratio
+    element_factor = np.where(_ELEV_IS_BACK, _ELEV_ELEMENT_FRONT * back_attenuation, _ELEV_ELEMENT_FRONT)
+    front_mag = ground_factor * element_factor * 100
+    elevation_pattern = [
+        {"angle": angle, "magnitude": round(max(magnitude, 1), 1)}
+        for angle, magnitude in zip(_ELEV_FRONT_ANGLES, front_mag.tolist())
+    ]
+    elevation_pattern.extend({"angle": angle, "magnitude": 1.0} for angle in _ELEV_BELOW_ANGLES)
 
     # Stacking
     stacking_enabled = False
     stacking_info = None
     stacked_gain_dbi = None
+    stacked_gain_linear = None
     stacked_pattern = None
     if input_data.stacking and input_data.stacking.enabled:
         stacking_enabled = True
@@ -1818,43 +2128,39 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
                 new_beamwidth_v = beamwidth_v
             stacked_pattern = generate_stacked_pattern(far_field_pattern, stacking.num_antennas, spacing_wavelengths, stacking.orientation)
 
+        stacked_gain_linear = math.exp(stacked_gain_dbi * _LN10_OVER_10)
         is_dual_stacking = is_dual
+        n_ant = stacking.num_antennas
         is_quad = stacking.layout == "quad"
-        actual_num = 4 if is_quad else stacking.num_antennas
-        optimal_spacing_wl = 1.0 if stacking.orientation == "vertical" or is_quad else 0.65
-        optimal_spacing_ft = round((wavelength * optimal_spacing_wl) / 0.3048, 1)
-        min_spacing_wl = 0.5 if stacking.orientation == "vertical" or is_quad else 0.65
+        is_vertical = stacking.orientation == "vertical"
+        actual_num = 4 if is_quad else n_ant
+        optimal_spacing_wl = 1.0 if is_vertical or is_quad else 0.65
+        optimal_spacing_ft = round(wavelength_ft * optimal_spacing_wl, 1)
+        min_spacing_wl = 0.5 if is_vertical or is_quad else 0.65
 
-        if stacking.orientation == "vertical" or is_quad:
+        if is_vertical or is_quad:
             if spacing_wavelengths >= 2.0: isolation_db = 30
             elif spacing_wavelengths >= 1.0: isolation_db = 20 + (spacing_wavelengths - 1.0) * 10
             elif spacing_wavelengths >= 0.5: isolation_db = 12 + (spacing_wavelengths - 0.5) * 16
             else: isolation_db = max(5, spacing_wavelengths * 24)
         else: isolation_db = 15
+        iso_label = f"~{round(isolation_db)}dB"
+        close_coupling = spacing_wavelengths < 0.25
 
-        spacing_status = "Too close — high mutual coupling" if spacing_wavelengths < 0.25 else ("Minimum — some coupling" if spacing_wavelengths < 0.5 else ("Good" if spacing_wavelengths < 1.0 else ("Optimal" if spacing_wavelengths < 2.0 else "Wide — diminishing returns")))
+        spacing_status = _STACK_SPACING_LABELS[bisect_right(_STACK_SPACING_THRESHOLDS, spacing_wavelengths)]
 
-        stacking_info = {"orientation": stacking.orientation, "layout": stacking.layout, "num_antennas": actual_num, "spacing": stacking.spacing, "spacing_unit": stacking.spacing_unit, "spacing_wavelengths": round(spacing_wavelengths, 3), "gain_increase_db": gain_increase, "new_beamwidth_h": new_beamwidth_h, "new_beamwidth_v": new_beamwidth_v, "stacked_multiplication_factor": round(10 ** (stacked_gain_dbi / 10), 2), "optimal_spacing_ft": optimal_spacing_ft, "min_spacing_ft": round((wavelength * min_spacing_wl) / 0.3048, 1), "spacing_status": spacing_status, "isolation_db": round(isolation_db, 1), "phasing": {"requirement": "0 deg phase — all feed lines identical length", "cable_note": "Cable lengths must match to the millimeter for proper phasing", "combiner": f"{stacking.num_antennas}:1 Hybrid Splitter/Combiner or Power Divider"}, "power_splitter": {"type": f"{stacking.num_antennas}:1 Power Splitter/Combiner", "input_impedance": "50 ohm", "combined_load": f"{round(50 / stacking.num_antennas, 1)} ohm (parallel)", "matching_method": "Quarter-wave (lambda/4) transformer", "quarter_wave_ft": round((wavelength * 0.25) / 0.3048, 1), "quarter_wave_in": round((wavelength * 0.25) / 0.0254, 1), "power_per_antenna_100w": round(100 / stacking.num_antennas, 1), "power_per_antenna_1kw": round(1000 / stacking.num_antennas, 1), "phase_lines": "All feed lines must be identical length for 0 deg phase shift", "min_power_rating": f"{round(1000 / stacking.num_antennas * 1.5)} W per port recommended", "isolation_note": "Port isolation prevents mismatch on one antenna from degrading others"}}
+        stacking_info = {"orientation": stacking.orientation, "layout": stacking.layout, "num_antennas": actual_num, "spacing": stacking.spacing, "spacing_unit": stacking.spacing_unit, "spacing_wavelengths": round(spacing_wavelengths, 3), "gain_increase_db": gain_increase, "new_beamwidth_h": new_beamwidth_h, "new_beamwidth_v": new_beamwidth_v, "stacked_multiplication_factor": round(stacked_gain_linear, 2), "optimal_spacing_ft": optimal_spacing_ft, "min_spacing_ft": round(wavelength_ft * min_spacing_wl, 1), "spacing_status": spacing_status, "isolation_db": round(isolation_db, 1), "phasing": dict(_stacking_phasing_block(n_ant)), "power_splitter": dict(_stacking_power_splitter_block(n_ant, wavelength_in, wavelength_ft))}
 
         if is_dual_stacking:
-            stacking_info["dual_stacking"] = {"note": "Stack identical dual-pol antennas only", "cross_pol": "Each antenna maintains H+V elements at their original angles", "mimo_capable": stacking.num_antennas >= 2, "mimo_note": "2x2 MIMO possible with cross-polarization for multipath diversity" if stacking.num_antennas >= 2 else "", "weatherproofing": "Use self-amalgamating tape on all exterior connectors", "wind_load": f"Stacked array of {stacking.num_antennas} antennas — verify mast rating"}
-
-        if stacking.orientation == "vertical" and not is_quad:
-            one_wl_ft = round(wavelength / 0.3048, 1)
-            spacing_vs_wl = spacing_wavelengths
-            alignment_status = "Optimal collinear" if 0.8 <= spacing_vs_wl <= 1.2 else ("Acceptable" if 0.5 <= spacing_vs_wl <= 2.0 else "Sub-optimal")
-            stacking_info["vertical_notes"] = {"alignment": "COLLINEAR — antennas must be on the same vertical axis", "effect": "Narrows vertical beamwidth, focusing power toward the horizon", "one_wavelength_ft": f"{one_wl_ft} ft (1\u03bb at {center_freq} MHz)", "alignment_status": alignment_status, "isolation": f"~{round(isolation_db)}dB isolation at current spacing", "far_field": {"elevation": "Compresses toward horizon", "azimuth": "Remains omnidirectional (360\u00b0)", "summary": "Vertical collinear stack: Maximum distance in ALL directions"}, "stagger_warning": "DO NOT offset horizontally", "coupling_warning": "Below 0.25\u03bb spacing causes severe mutual coupling" if spacing_wavelengths < 0.25 else "", "feed_line_note": "Feed lines MUST be identical length and type", "best_practice": f"Ideal spacing: ~1\u03bb ({one_wl_ft} ft center-to-center)"}
+            stacking_info["dual_stacking"] = {"note": "Stack identical dual-pol antennas only", "cross_pol": "Each antenna maintains H+V elements at their original angles", "mimo_capable": n_ant >= 2, "mimo_note": "2x2 MIMO possible with cross-polarization for multipath diversity" if n_ant >= 2 else "", "weatherproofing": "Use self-amalgamating tape on all exterior connectors", "wind_load": f"Stacked array of {n_ant} antennas — verify mast rating"}
 
-        if stacking.orientation == "horizontal" and not is_quad:
-            stacking_info["horizontal_notes"] = {"effect": "Narrows horizontal beamwidth", "far_field": {"elevation": "Stays wide", "azimuth": "Becomes directional with lobes and nulls", "summary": "Horizontal stack: Intentional coverage in specific directions only"}, "tradeoff": "Sacrifices omnidirectional coverage for directional gain", "feed_line_note": "Feed lines MUST be identical length and type", "isolation": f"~{round(isolation_db)}dB isolation at current spacing"}
-
-        if is_quad:
-            h_spacing_val = stacking.h_spacing if stacking.h_spacing else stacking.spacing
-            h_spacing_unit = stacking.h_spacing_unit if stacking.h_spacing else stacking.spacing_unit
-            stacking_info["quad_notes"] = {"layout": "2x2 H-Frame (2 vertical x 2 horizontal)", "effect": "Narrows BOTH vertical and horizontal beamwidth", "v_spacing": f"{stacking.spacing} {stacking.spacing_unit} (vertical)", "h_spacing": f"{h_spacing_val} {h_spacing_unit} (horizontal)", "h_frame_note": "Two antennas on horizontal cross-arm, two stacked vertically on mast", "isolation": f"~{round(isolation_db)}dB vertical isolation", "coupling_warning": "Below 0.25 lambda spacing causes severe mutual coupling" if spacing_wavelengths < 0.25 else "", "identical_note": "All 4 antennas MUST be identical models", "phasing_note": "Use 4-way equal-length phasing harness"}
+        layout_key = "quad" if is_quad else stacking.orientation
+        if layout_key in _STACKING_LAYOUT_NOTES:
+            notes_key, build_notes = _STACKING_LAYOUT_NOTES[layout_key]
+            stacking_info[notes_key] = build_notes(stacking, wavelength_ft, spacing_wavelengths, iso_label, close_coupling, center_freq)
         beamwidth_h, beamwidth_v = new_beamwidth_h, new_beamwidth_v
 
-    swr_desc = "Perfect" if swr <= 1.1 else ("Excellent" if swr <= 1.3 else ("Very Good" if swr <= 1.5 else ("Good" if swr <= 2.0 else "Fair")))
+    swr_desc = _SWR_LABELS[bisect_left(_SWR_THRESHOLDS, swr)]
 
     taper_info = None
     if input_data.taper and input_data.taper.enabled:
@@ -1863,8 +2169,9 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
     # Wind load
     boom_dia_in = boom_dia_m / 0.0254
     num_stacked = stacking.num_antennas if stacking_enabled and input_data.stacking else 1
-    element_dicts = [{"length": e.length, "diameter": e.diameter, "position": e.position} for e in input_data.elements]
-    wind_load_info = calculate_wind_load(elements=element_dicts, boom_dia_in=boom_dia_in, boom_length_in=boom_length_in, is_dual=is_dual, num_stacked=num_stacked)
+    wind_load_info = calculate_wind_load(elements=input_data.elements, boom_dia_in=boom_dia_in, boom_length_in=boom_length_in, is_dual=is_dual, num_stacked=num_stacked)
+
+    noise_level, noise_description = _NOISE_TABLE.get(input_data.antenna_orientation, _NOISE_DEFAULT)
 
     return AntennaOutput(
         swr=swr, swr_description=f"{swr_desc} match - {swr}:1",
@@ -1872,7 +2179,7 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
         fs_ratio=fs_ratio, fs_ratio_description=f"{fs_ratio} dB front-to-side",
         beamwidth_h=beamwidth_h, beamwidth_v=beamwidth_v, beamwidth_description=f"H: {beamwidth_h}\u00b0 / V: {beamwidth_v}\u00b0",
         bandwidth=bandwidth_mhz, bandwidth_description=f"{usable_2_0:.3f} MHz at 2:1 SWR",
-        gain_dbi=gain_dbi, gain_description=f"{round(10 ** ((stacked_gain_dbi or gain_dbi) / 10), 2)}x over isotropic",
+        gain_dbi=gain_dbi, gain_description=f"{round(stacked_gain_linear if stacked_gain_dbi else gain_linear, 2)}x over isotropic",
         base_gain_dbi=base_gain_dbi, gain_breakdown=gain_breakdown,
         multiplication_factor=multiplication_factor, multiplication_description="ERP multiplier",
         antenna_efficiency=antenna_efficiency, efficiency_description=f"{antenna_efficiency}% efficient",
@@ -1892,8 +2199,7 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
         forward_power_watts=forward_power_watts,
         takeoff_angle=takeoff_angle, takeoff_angle_description=takeoff_desc,
         height_performance=height_perf, ground_radials_info=ground_radials_info,
-        noise_level="Moderate" if input_data.antenna_orientation in ("dual", "angle45") else ("High" if input_data.antenna_orientation == "vertical" else "Low"),
-        noise_description="Dual polarity receives both H and V — moderate noise, excellent for fading/skip" if input_data.antenna_orientation == "dual" else ("Vertical polarization picks up more man-made noise (QRN)" if input_data.antenna_orientation == "vertical" else ("45\u00b0 slant receives both polarizations — moderate noise" if input_data.antenna_orientation == "angle45" else "Horizontal polarization has a quieter receive noise floor")),
+        noise_level=noise_level, noise_description=noise_description,
         feed_type=feed_type, matching_info=matching_info, matching_recommendation=matching_recommendation, dual_polarity_info=dual_info,
         wind_load=wind_load_info,
         boom_correction_info=boom_correction if boom_correction.get("enabled") else boom_correction,
@@ -1908,13 +2214,87 @@ def calculate_antenna_parameters(input_data: AntennaInput) -> AntennaOutput:
 # Auto-tune function
 # ════════════════════════════════════════════════════════════════
 
+# Spacing overrides (in wavelengths). "Close" fields accept 'vclose'/'close'/True,
+# "far" fields accept 'far'/'vfar'/True.
+_DRIVEN_LAMBDA = {'vclose': 0.08, 'close': 0.12, 'far': 0.22, 'vfar': 0.28}
+_DRIVEN_CLOSE_LAMBDA = {'vclose': 0.08, 'close': 0.12, True: 0.12}
+_DRIVEN_FAR_LAMBDA = {'vfar': 0.28, 'far': 0.22, True: 0.22}
+_DIR1_CLOSE_LAMBDA = {'vclose': 0.06, 'close': 0.10, True: 0.10}
+_DIR1_FAR_LAMBDA = {'vfar': 0.22, 'far': 0.18, True: 0.18}
+_DIR2_CLOSE_LAMBDA = {'vclose': 0.08, 'close': 0.12, True: 0.12}
+_DIR2_FAR_LAMBDA = {'vfar': 0.28, 'far': 0.22, True: 0.22}
+_DIR_PRESET_LAMBDA = {'vclose': 0.06, 'close': 0.10, 'normal': 0.13, 'far': 0.18, 'vfar': 0.22}
+
+
+def _resolve_lambda(close_val, far_val, close_map: dict, far_map: dict, default: float) -> float:
+    """Spacing for a close/far override pair; the close setting wins."""
+    lam = close_map.get(close_val)
+    if lam is None:
+        lam = far_map.get(far_val)
+    return default if lam is None else lam
+
+
+def _resolve_driven_lambda(close_val, far_val, default: float = None) -> float:
+    """Reflector–driven spacing from the close_driven/far_driven overrides.
+
+    Whichever override is set is looked up in the full vclose..vfar table; a bare
+    True means 'close' or 'far' depending on the field. An unrecognized close value
+    falls back to the far setting.
+    """
+    override = close_val or far_val
+    if override is True:
+        return 0.12 if close_val else 0.22
+    lam = _DRIVEN_LAMBDA.get(override)
+    if lam is None and close_val:
+        lam = _DRIVEN_FAR_LAMBDA.get(far_val)
+    return default if lam is None else lam
+
+
+def _equal_spaced_positions(start: float, span: float, count: int) -> list:
+    """count positions after start, one rounded step (span/count) apart, each rounded to 0.1\"."""
+    step = round(span / count, 1)
+    return [round(p, 1) for p in (start + step * np.arange(1, count + 1)).tolist()]
+
+
+def _spacing_corrections(refl_driven_lambda: float, dir1_lambda: float = None) -> tuple:
+    """Gain/F-B adjustments for the as-built reflector and first-director spacing.
+
+    Returns (gain_adj_db, fb_adj_db), clamped and rounded for the auto-tune prediction.
+    """
+    optimal_gain_lambda = 0.20
+    if refl_driven_lambda < optimal_gain_lambda:
+        gain_adj = 0.0 - 2.5 * (optimal_gain_lambda - refl_driven_lambda) / 0.1
+    else:
+        gain_adj = 0.0 - 1.5 * (refl_driven_lambda - optimal_gain_lambda) / 0.1
+    optimal_fb_lambda = 0.15
+    if refl_driven_lambda <= optimal_fb_lambda:
+        fb_adj = 2.0 - 5.0 * (optimal_fb_lambda - refl_driven_lambda) / 0.1
+    elif refl_driven_lambda <= 0.20:
+        fb_adj = 2.0 - 4.0 * (refl_driven_lambda - optimal_fb_lambda) / 0.05
+    else:
+        fb_adj = -3.0 * (refl_driven_lambda - 0.20) / 0.1
+    if dir1_lambda is not None:
+        optimal_dir1 = 0.13
+        dir1_dev = abs(dir1_lambda - optimal_dir1)
+        if dir1_dev > 0.05:
+            gain_adj -= 0.3 * (dir1_dev - 0.05) / 0.05
+            fb_adj += 0.5 if dir1_lambda < optimal_dir1 else -0.5
+    return round(_clamp(gain_adj, -1.5, 0.5), 2), round(_clamp(fb_adj, -4.0, 3.0), 1)
+
+
 def auto_tune_antenna(request: AutoTuneRequest) -> AutoTuneOutput:
     band_info = BAND_DEFINITIONS.get(request.band, BAND_DEFINITIONS["11m_cb"])
     center_freq = request.frequency_mhz if request.frequency_mhz else band_info["center"]
-    c = 299792458
-    wavelength_m = c / (center_freq * 1e6)
-    wavelength_in = wavelength_m * 39.3701
+    wavelength_m = C_MPS / (center_freq * 1e6)
+    wavelength_in = wavelength_m * M_TO_IN
     n = request.num_elements
+    close_driven = getattr(request, 'close_driven', False)
+    far_driven = getattr(request, 'far_driven', False)
+    # Reflector–driven spacing asked for by the user (None = use the build style)
+    requested_driven_lambda = _resolve_driven_lambda(close_driven, far_driven)
+    # Boom cap in inches, or None when the boom lock is off / unset
+    boom_limit = getattr(request, 'max_boom_length', None) if getattr(request, 'boom_lock_enabled', False) else None
+    taper_enabled = bool(request.taper and request.taper.enabled)
     elements = []
     notes = []
     driven_length = round(wavelength_in * 0.473, 1)
@@ -1969,25 +2349,15 @@ def auto_tune_antenna(request: AutoTuneRequest) -> AutoTuneOutput:
     notes.append(profile['notes'])
 
     if use_reflector:
-        driven_override = getattr(request, 'close_driven', False) or getattr(request, 'far_driven', False)
-        if driven_override == 'vclose': refl_driven_lambda = 0.08
-        elif driven_override == 'close' or (driven_override is True and getattr(request, 'close_driven', False)): refl_driven_lambda = 0.12
-        elif driven_override == 'far' or (driven_override is True and getattr(request, 'far_driven', False)): refl_driven_lambda = 0.22
-        elif driven_override == 'vfar': refl_driven_lambda = 0.28
-        elif getattr(request, 'close_driven', False) == 'vclose': refl_driven_lambda = 0.08
-        elif getattr(request, 'close_driven', False) == 'close' or getattr(request, 'close_driven', False) is True: refl_driven_lambda = 0.12
-        elif getattr(request, 'far_driven', False) == 'vfar': refl_driven_lambda = 0.28
-        elif getattr(request, 'far_driven', False) == 'far' or getattr(request, 'far_driven', False) is True: refl_driven_lambda = 0.22
-        else: refl_driven_lambda = profile['refl_driven']  # Use build style default
+        refl_driven_lambda = requested_driven_lambda if requested_driven_lambda is not None else profile['refl_driven']
         # For gamma/hairpin with low element counts, tighten reflector spacing to lower Z
         if feed_type == 'gamma' and n <= 4 and refl_driven_lambda >= 0.18:
             refl_driven_lambda = 0.12 if n <= 2 else 0.14 if n <= 3 else 0.15
         elif feed_type == 'hairpin' and n <= 3 and refl_driven_lambda >= 0.18:
             refl_driven_lambda = 0.14
         refl_driven_gap = round(refl_driven_lambda * wavelength_in, 1)
-        if getattr(request, 'boom_lock_enabled', False) and getattr(request, 'max_boom_length', None):
-            max_boom = request.max_boom_length
-            max_driven_pos = max_boom * 0.4
+        if boom_limit:
+            max_driven_pos = boom_limit * 0.4
             if refl_driven_gap > max_driven_pos:
                 refl_driven_gap = round(max_driven_pos, 1)
         elements.append({"element_type": "reflector", "length": round(driven_length * 1.05, 1), "diameter": 0.5, "position": 0})
@@ -2004,19 +2374,29 @@ def auto_tune_antenna(request: AutoTuneRequest) -> AutoTuneOutput:
         remaining_boom = target_boom
         current_position = 0
 
-    if request.spacing_lock_enabled and request.locked_positions:
+    # Element order is fixed by construction: [reflector], driven, directors...
+    driven_idx = 1 if use_reflector else 0
+    first_dir_idx = driven_idx + 1
+
+    spacing_locked = bool(request.spacing_lock_enabled and request.locked_positions)
+    # Director lengths taper from 95% of driven: fixed 2%/director when spacing is locked,
+    # the build-style taper otherwise
+    length_taper = 0.02 if spacing_locked else profile['driven_taper']
+    dir_lengths = [round(x, 1) for x in (driven_length * (0.95 - np.arange(num_directors) * length_taper)).tolist()]
+
+    if spacing_locked:
         for i, elem in enumerate(elements):
             if i < len(request.locked_positions):
                 elem["position"] = request.locked_positions[i]
+        director_spacing = remaining_boom / num_directors if num_directors > 0 else remaining_boom
         for i in range(num_directors):
-            position_idx = (2 if use_reflector else 1) + i
+            position_idx = first_dir_idx + i
             if position_idx < len(request.locked_positions):
                 locked_pos = request.locked_positions[position_idx]
             else:
-                director_spacing = remaining_boom / num_directors if num_directors > 0 else remaining_boom
                 current_position += director_spacing
                 locked_pos = current_position
-            director_length = round(driven_length * (0.95 - i * 0.02), 1)
+            director_length = dir_lengths[i]
             elements.append({"element_type": "director", "length": director_length, "diameter": 0.5, "position": locked_pos})
             notes.append(f"Director {i+1}: {director_length}\" at {locked_pos}\" (spacing locked)")
         notes.append("Spacing Lock: Positions preserved, only lengths optimized")
@@ -2026,12 +2406,6 @@ def auto_tune_antenna(request: AutoTuneRequest) -> AutoTuneOutput:
             dir_presets = getattr(request, 'dir_presets', None) or {}
             dir_nudge_counts = getattr(request, 'dir_nudge_counts', None) or {}
             
-            # Preset-to-lambda mapping
-            preset_lambda = {
-                'vclose': 0.06, 'close': 0.10, 'normal': 0.13,
-                'far': 0.18, 'vfar': 0.22
-            }
-            
             # Legacy dir1/dir2 overrides as fallback
             close_d1 = getattr(request, 'close_dir1', False)
             far_d1 = getattr(request, 'far_dir1', False)
@@ -2042,24 +2416,19 @@ def auto_tune_antenna(request: AutoTuneRequest) -> AutoTuneOutput:
                 """Get spacing lambda for a director index (0-based)."""
                 # Check dir_presets first
                 preset = dir_presets.get(str(dir_idx)) or dir_presets.get(dir_idx)
-                if preset and preset in preset_lambda:
-                    return preset_lambda[preset]
+                if preset and preset in _DIR_PRESET_LAMBDA:
+                    return _DIR_PRESET_LAMBDA[preset]
                 # Legacy fallbacks for dir1 and dir2
                 if dir_idx == 0:
-                    if close_d1 == 'vclose': return 0.06
-                    elif close_d1 == 'close' or close_d1 is True: return 0.10
-                    elif far_d1 == 'vfar': return 0.22
-                    elif far_d1 == 'far' or far_d1 is True: return 0.18
-                    return profile['dir_base']  # Use build style
+                    return _resolve_lambda(close_d1, far_d1, _DIR1_CLOSE_LAMBDA, _DIR1_FAR_LAMBDA,
+                                           profile['dir_base'])  # Use build style
                 elif dir_idx == 1:
-                    if close_d2 == 'vclose': return 0.08
-                    elif close_d2 == 'close' or close_d2 is True: return 0.12
-                    elif far_d2 == 'vfar': return 0.28
-                    elif far_d2 == 'far' or far_d2 is True: return 0.22
-                    return profile['dir_base'] + profile['dir_increment']
+                    return _resolve_lambda(close_d2, far_d2, _DIR2_CLOSE_LAMBDA, _DIR2_FAR_LAMBDA,
+                                           profile['dir_base'] + profile['dir_increment'])
                 # Directors 3+ use graduated spacing from build style
                 return profile['dir_base'] + dir_idx * profile['dir_increment']
 
+            dir_lambdas = []
             for i in range(num_directors):
                 dir_lambda = get_dir_lambda(i)
                 # Apply nudge adjustments (each nudge = ~0.5" which is ~0.001λ)
@@ -2067,17 +2436,27 @@ def auto_tune_antenna(request: AutoTuneRequest) -> AutoTuneOutput:
                 if nudge_count:
                     nudge_lambda = nudge_count * 0.001
                     dir_lambda += nudge_lambda
-
-                director_spacing = round(dir_lambda * wavelength_in, 1)
-                if getattr(request, 'boom_lock_enabled', False) and getattr(request, 'max_boom_length', None):
-                    max_dir = (request.max_boom_length - current_position) * (0.5 if i < 2 else 0.3)
+                dir_lambdas.append(dir_lambda)
+            dir_spacings = [round(lam * wavelength_in, 1) for lam in dir_lambdas]
+
+            if boom_limit:
+                # Each gap is capped by the boom left after the previous director
+                dir_positions = []
+                for i, director_spacing in enumerate(dir_spacings):
+                    max_dir = (boom_limit - current_position) * (0.5 if i < 2 else 0.3)
                     if director_spacing > max_dir:
                         director_spacing = round(max_dir, 1)
-                current_position += director_spacing
-                director_length = round(driven_length * (0.95 - i * profile['driven_taper']), 1)
-                elements.append({"element_type": "director", "length": director_length, "diameter": 0.5, "position": round(current_position, 1)})
+                    current_position += director_spacing
+                    dir_positions.append(current_position)
+            else:
+                # Running sum seeded with the start position (same left-to-right adds as +=)
+                dir_positions = np.cumsum([current_position] + dir_spacings)[1:].tolist()
+
+            for i, (dir_lambda, pos, director_length) in enumerate(zip(dir_lambdas, dir_positions, dir_lengths)):
+                director_pos = round(pos, 1)
+                elements.append({"element_type": "director", "length": director_length, "diameter": 0.5, "position": director_pos})
                 preset_label = dir_presets.get(str(i), '') or ''
-                notes.append(f"Director {i+1}: {director_length}\" at {round(current_position, 1)}\" ({dir_lambda:.3f}\u03bb{' ' + preset_label if preset_label else ''})")
+                notes.append(f"Director {i+1}: {director_length}\" at {director_pos}\" ({dir_lambda:.3f}\u03bb{' ' + preset_label if preset_label else ''})")
 
     notes.append(f"")
     notes.append(f"Wavelength at {center_freq} MHz: {round(wavelength_in, 1)}\"")
@@ -2097,95 +2476,71 @@ def auto_tune_antenna(request: AutoTuneRequest) -> AutoTuneOutput:
         else:
             notes.append(f"Note: Long spacing may increase gain by ~{round((spacing_factor - 1) * 1.5, 1)} dB but widen beamwidth")
 
-    if request.boom_lock_enabled and request.max_boom_length:
-        target_boom = request.max_boom_length
-        refl_idx = next((i for i, e in enumerate(elements) if e["element_type"] == "reflector"), None)
-        driven_idx = next((i for i, e in enumerate(elements) if e["element_type"] == "driven"), None)
-        dir_indices = [i for i, e in enumerate(elements) if e["element_type"] == "director"]
-        if driven_idx is not None:
-            if refl_idx is not None:
-                elements[refl_idx]["position"] = 0
-                if len(dir_indices) > 0:
-                    refl_driven_gap = round(target_boom * 0.15, 1)
-                    elements[driven_idx]["position"] = refl_driven_gap
-                    remaining = target_boom - refl_driven_gap
-                    dir_spacing = round(remaining / len(dir_indices), 1)
-                    for j, idx in enumerate(dir_indices):
-                        elements[idx]["position"] = round(refl_driven_gap + dir_spacing * (j + 1), 1)
-                else:
-                    elements[driven_idx]["position"] = round(target_boom, 1)
+    if boom_limit:
+        target_boom = boom_limit
+        dir_indices = range(first_dir_idx, len(elements))
+        if use_reflector:
+            elements[0]["position"] = 0
+            if len(dir_indices) > 0:
+                refl_driven_gap = round(target_boom * 0.15, 1)
+                elements[driven_idx]["position"] = refl_driven_gap
+                dir_positions = _equal_spaced_positions(refl_driven_gap, target_boom - refl_driven_gap, len(dir_indices))
+                for idx, pos in zip(dir_indices, dir_positions):
+                    elements[idx]["position"] = pos
             else:
-                elements[driven_idx]["position"] = 0
-                if len(dir_indices) > 0:
-                    dir_spacing = round(target_boom / len(dir_indices), 1)
-                    for j, idx in enumerate(dir_indices):
-                        elements[idx]["position"] = round(dir_spacing * (j + 1), 1)
+                elements[driven_idx]["position"] = round(target_boom, 1)
+        else:
+            elements[driven_idx]["position"] = 0
+            if len(dir_indices) > 0:
+                dir_positions = _equal_spaced_positions(0, target_boom, len(dir_indices))
+                for idx, pos in zip(dir_indices, dir_positions):
+                    elements[idx]["position"] = pos
         notes.append(f"")
         notes.append(f"Boom Restraint: {target_boom}\" ({round(target_boom/12, 1)} ft) — elements equally spaced")
         compression_penalty = 0
     else:
         compression_penalty = 0
 
-    final_boom = max(e['position'] for e in elements) if elements else 0
+    # Positions are final from here on; the summary works on a flat array
+    positions = np.array([e["position"] for e in elements], dtype=np.float64)
+    final_boom = positions.max().item()
     notes.append(f"")
     notes.append(f"Total boom length: ~{round(final_boom, 1)}\" ({round(final_boom/12, 1)} ft)")
 
-    base_predicted_swr = 1.05 if request.taper and request.taper.enabled else 1.1
+    base_predicted_swr = 1.05 if taper_enabled else 1.1
     predicted_swr = base_predicted_swr if use_reflector else base_predicted_swr + 0.1
 
     base_gain = get_free_space_gain(n)
     standard_boom_in = get_standard_boom_in(n, wavelength_in)
+    # Boom length vs. standard in octaves; shared by the gain and F/B boom adjustments
+    boom_octaves = None
     if final_boom > 0 and standard_boom_in > 0:
         boom_ratio = final_boom / standard_boom_in
         if boom_ratio > 0 and boom_ratio != 1.0:
-            boom_adj = round(2.5 * math.log2(boom_ratio), 2)
-            base_gain += boom_adj
+            boom_octaves = math.log2(boom_ratio)
+    if boom_octaves is not None:
+        base_gain += round(2.5 * boom_octaves, 2)
     if not use_reflector: base_gain -= 1.5
-    if request.taper and request.taper.enabled:
+    if taper_enabled:
         base_gain += 0.3 * request.taper.num_tapers
 
     # Position-based spacing corrections
     spacing_gain_adj = 0.0
     spacing_fb_adj = 0.0
-    refl_elem = next((e for e in elements if e["element_type"] == "reflector"), None)
-    driven_elem_final = next((e for e in elements if e["element_type"] == "driven"), None)
-    dir_elems = sorted([e for e in elements if e["element_type"] == "director"], key=lambda e: e["position"])
-
-    if refl_elem and driven_elem_final and n >= 3:
-        refl_driven_in = abs(driven_elem_final["position"] - refl_elem["position"])
+    if use_reflector and n >= 3:
+        driven_pos = positions[driven_idx].item()
+        refl_driven_in = abs(driven_pos - positions[0].item())
         refl_driven_lambda = (refl_driven_in * 0.0254) / wavelength_m if wavelength_m > 0 else 0.18
-        optimal_gain_lambda = 0.20
-        if refl_driven_lambda < optimal_gain_lambda:
-            spacing_gain_adj -= 2.5 * (optimal_gain_lambda - refl_driven_lambda) / 0.1
-        else:
-            spacing_gain_adj -= 1.5 * (refl_driven_lambda - optimal_gain_lambda) / 0.1
-        optimal_fb_lambda = 0.15
-        if refl_driven_lambda <= optimal_fb_lambda:
-            spacing_fb_adj = 2.0 - 5.0 * (optimal_fb_lambda - refl_driven_lambda) / 0.1
-        elif refl_driven_lambda <= 0.20:
-            spacing_fb_adj = 2.0 - 4.0 * (refl_driven_lambda - optimal_fb_lambda) / 0.05
-        else:
-            spacing_fb_adj = -3.0 * (refl_driven_lambda - 0.20) / 0.1
-        if len(dir_elems) >= 1:
-            dir1_in = abs(dir_elems[0]["position"] - driven_elem_final["position"])
+        dir1_lambda = None
+        if len(positions) > first_dir_idx:
+            dir1_in = abs(positions[first_dir_idx:].min().item() - driven_pos)
             dir1_lambda = (dir1_in * 0.0254) / wavelength_m if wavelength_m > 0 else 0.13
-            optimal_dir1 = 0.13
-            dir1_dev = abs(dir1_lambda - optimal_dir1)
-            if dir1_dev > 0.05:
-                spacing_gain_adj -= 0.3 * (dir1_dev - 0.05) / 0.05
-                spacing_fb_adj += 0.5 if dir1_lambda < optimal_dir1 else -0.5
-        spacing_gain_adj = round(max(-1.5, min(0.5, spacing_gain_adj)), 2)
-        spacing_fb_adj = round(max(-4.0, min(3.0, spacing_fb_adj)), 1)
-        if request.boom_lock_enabled and request.max_boom_length:
-            close_d = request.close_driven
-            far_d = request.far_driven
-            if close_d == 'vclose': requested_lambda = 0.08
-            elif close_d == 'close' or close_d is True: requested_lambda = 0.12
-            elif far_d == 'vfar': requested_lambda = 0.28
-            elif far_d == 'far' or far_d is True: requested_lambda = 0.22
-            else: requested_lambda = 0.18
+        spacing_gain_adj, spacing_fb_adj = _spacing_corrections(refl_driven_lambda, dir1_lambda)
+        if boom_limit:
+            # The note reports the close-first request, independent of the geometry override above
+            requested_lambda = _resolve_lambda(close_driven, far_driven, _DRIVEN_CLOSE_LAMBDA, _DRIVEN_FAR_LAMBDA, 0.18)
             actual_vs_requested = abs(refl_driven_lambda - requested_lambda)
-            if actual_vs_requested > 0.02 and (request.close_driven or request.far_driven):
+            if actual_vs_requested > 0.02 and (close_driven or far_driven):
                 notes.append(f"Note: Boom restraint limits driven spacing to {round(refl_driven_lambda, 3)}\u03bb (requested {requested_lambda}\u03bb). Use a longer boom for full effect.")
 
     base_gain += spacing_gain_adj
@@ -2194,14 +2549,11 @@ def auto_tune_antenna(request: AutoTuneRequest) -> AutoTuneOutput:
 
     if n <= 5: predicted_fb = {2: 14, 3: 20, 4: 24, 5: 26}.get(n, 14)
     else: predicted_fb = 20 + 3 * math.log2(max(n - 2, 1))
-    if final_boom > 0 and standard_boom_in > 0:
-        boom_ratio = final_boom / standard_boom_in
-        if boom_ratio > 0 and boom_ratio != 1.0:
-            fb_boom_adj = round(1.5 * math.log2(boom_ratio), 1)
-            predicted_fb += fb_boom_adj
+    if boom_octaves is not None:
+        predicted_fb += round(1.5 * boom_octaves, 1)
     predicted_fb += spacing_fb_adj
     if not use_reflector: predicted_fb -= 8
-    if request.taper and request.taper.enabled:
+    if taper_enabled:
         predicted_fb += 1.5 * request.taper.num_tapers
     if not use_reflector:
         notes.append(f"Note: No reflector mode - reduced F/B ratio")
@@ -2232,13 +2584,37 @@ def design_gamma_match(num_elements: int, driven_element_length_in: float,
                        custom_teflon_length: float = None,
                        custom_tube_length: float = None,
                        driven_element_dia: float = 1.0) -> dict:
-    """Design a gamma match recipe using the SAME physics as apply_matching_network()."""
+    """Design a gamma match recipe using the SAME physics as apply_matching_network().
+
+    Results are cached by input; each call returns its own copy of the cached design.
+    """
+    return copy.deepcopy(_design_gamma_match(
+        num_elements, driven_element_length_in, frequency_mhz, feedpoint_impedance,
+        element_resonant_freq_mhz, reflector_spacing_in,
+        tuple(director_spacings_in) if director_spacings_in is not None else None,
+        custom_tube_od, custom_rod_od, custom_rod_spacing, custom_teflon_length,
+        custom_tube_length, driven_element_dia,
+    ))
+
+
+@lru_cache(maxsize=512)
+def _design_gamma_match(num_elements: int, driven_element_length_in: float,
+                        frequency_mhz: float,
+                        feedpoint_impedance: float,
+                        element_resonant_freq_mhz: float,
+                        reflector_spacing_in: float,
+                        director_spacings_in: tuple,
+                        custom_tube_od: float, custom_rod_od: float,
+                        custom_rod_spacing: float,
+                        custom_teflon_length: float,
+                        custom_tube_length: float,
+                        driven_element_dia: float) -> dict:
     hw = get_gamma_hardware_defaults(num_elements)
     wall = hw["wall"]
     half_len = driven_element_length_in / 2.0
     wavelength_in = 11802.71 / frequency_mhz
     tube_length = custom_tube_length if custom_tube_length and custom_tube_length > 0 else hw["tube_length"]
-    wavelength_m = 299792458.0 / (frequency_mhz * 1e6)
+    wavelength_m = C_MPS / (frequency_mhz * 1e6)
     refl_gap_in = reflector_spacing_in if reflector_spacing_in and reflector_spacing_in > 0 else 48.0
 
     # Element resonant frequency: use provided value or compute via shared helper
@@ -2273,7 +2649,6 @@ def design_gamma_match(num_elements: int, driven_element_length_in: float,
             director_spacings_in=director_spacings_in,
             cumulative=False,  # Gamma designer receives individual gaps
         )
-    swr_unmatched = max(50.0 / max(r_feed, 1), r_feed / 50.0)
 
     # Hardware selection: custom overrides or unified defaults
     is_custom = bool(custom_tube_od or custom_rod_od)
@@ -2305,7 +2680,7 @@ def design_gamma_match(num_elements: int, driven_element_length_in: float,
     if tube_id <= rod_od:
         return {"error": f"Tube ID ({tube_id:.3f}\") must be larger than rod OD ({rod_od:.3f}\"). Increase tube OD or decrease rod OD."}
 
-    cap_per_inch = 1.413 * 2.1 / math.log(tube_id / rod_od)
+    cap_per_inch = _gamma_cap_per_inch(tube_id, rod_od)
     id_rod_ratio = tube_id / rod_od
     gamma_rod_length = hw["rod_length"]
     teflon_sleeve = custom_teflon_length if custom_teflon_length and custom_teflon_length > 0 else tube_length + 1.0
@@ -2319,34 +2694,36 @@ def design_gamma_match(num_elements: int, driven_element_length_in: float,
     else:
         bar_min = effective_teflon
 
-    # Helper: call apply_matching_network() for a given bar + cap_pf
+    # Gamma-section constants shared by every evaluation below
+    z0_gamma = _gamma_z0(driven_element_dia, rod_od, rod_spacing)
+    x_ant, _ = _gamma_antenna_reactance(r_feed, num_elements, frequency_mhz, element_res_freq)
+    kernel_half_len = max(half_len, 1.0)
+    # apply_matching_network reports the cap of its default 8" insertion
+    nominal_cap_pf = round(cap_per_inch * 8.0, 1)
+
+    # Helper: the apply_matching_network() gamma physics for a given bar + cap_pf,
+    # returned as (matched_swr, _GammaPoint). Cached per request so repeated design
+    # points are only evaluated once.
+    @lru_cache(maxsize=None)
     def _eval(bar: float, cap_pf: float) -> tuple:
-        matched_swr, info = apply_matching_network(
-            swr=swr_unmatched, feed_type='gamma', feedpoint_r=r_feed,
-            gamma_rod_dia=rod_od, gamma_rod_spacing=rod_spacing,
-            gamma_bar_pos=bar, gamma_cap_pf=cap_pf if cap_pf > 0 else 0.001,
-            gamma_tube_od=tube_od,
-            gamma_tube_length=tube_length,
-            operating_freq_mhz=frequency_mhz,
-            num_elements=num_elements,
-            driven_element_half_length_in=half_len,
-            driven_element_dia_in=driven_element_dia,
-            element_resonant_freq_mhz=element_res_freq,
-        )
-        return matched_swr, info
+        return _gamma_point(bar, cap_pf if cap_pf > 0 else 0.001, z0_gamma, kernel_half_len,
+                            r_feed, x_ant, frequency_mhz, nominal_cap_pf)
+
+    def _reactances(bar: float, gamma_z0: float = z0_gamma) -> tuple:
+        """(K, X_stub) at a bar position, rounded as _eval reports them."""
+        k, xs = _gamma_reactance_kernel(bar, gamma_z0, kernel_half_len, frequency_mhz)
+        return round(float(k), 3), round(float(xs), 2)
 
     # Get ideal bar position from the same coupling formula as apply_matching_network
-    _, probe_info = _eval(13.0, 8.0)
-    coupling_multiplier = probe_info.get("coupling_multiplier", 4.5)
-    x_antenna_at_center = probe_info.get("x_antenna", 0)  # antenna reactance at operating freq
+    coupling_multiplier = round(z0_gamma / 73.0, 3)
+    x_antenna_at_center = round(x_ant, 2)  # antenna reactance at operating freq
 
     k_ideal = math.sqrt(50.0 / max(r_feed, 5.0))
     bar_ideal = half_len * (k_ideal - 1.0) / coupling_multiplier
-    bar_ideal_clamped = max(bar_min, min(bar_ideal, gamma_rod_length))
+    bar_ideal_clamped = _clamp(bar_ideal, bar_min, gamma_rod_length)
 
     # Find null ANALYTICALLY: X_antenna*K + X_stub + X_cap = 0
-    _, stub_info = _eval(bar_ideal_clamped, 0.001)
-    x_stub_val = stub_info.get("x_stub", 0)
+    _, x_stub_val = _reactances(bar_ideal_clamped)
     x_ant_k = x_antenna_at_center * k_ideal  # antenna X transformed by K
 
     # Max rod insertion: rod stops 0.5" before teflon end to avoid shorting on tube
@@ -2354,11 +2731,13 @@ def design_gamma_match(num_elements: int, driven_element_length_in: float,
     max_insertion = tube_length - 0.5
 
     # Null: cap must cancel both antenna reactance and stub inductance
-    omega = 2.0 * math.pi * frequency_mhz * 1e6
+    omega = TWO_PI * frequency_mhz * 1e6
+    pf_ohms = 1e12 / omega  # C (pF) = pf_ohms / X_C (ohms)
+    bar_span = gamma_rod_length - bar_min
     null_reachable = True
     positive_x_total = x_ant_k + x_stub_val  # total reactance to cancel with cap
     if positive_x_total > 0:
-        c_needed_pf = 1e12 / (omega * positive_x_total)
+        c_needed_pf = pf_ohms / positive_x_total
         optimal_insertion = c_needed_pf / cap_per_inch
         if optimal_insertion > max_insertion or optimal_insertion < 0:
             null_reachable = False
@@ -2375,42 +2754,35 @@ def design_gamma_match(num_elements: int, driven_element_length_in: float,
     best_swr_opt = 999.0
     best_bar_opt = bar_ideal_clamped
     best_cap_opt = c_needed_pf if null_reachable else max_insertion * cap_per_inch
-    # Sweep from bar_min out to rod length in fine steps
+    # Sweep from bar_min out to rod length in fine steps. The whole sweep runs through
+    # the array form of the _eval physics: K and X_stub once per bar, then the SWR at
+    # that bar's null cap. The null search uses them rounded as _eval reports them.
     steps = 200
-    for i in range(steps + 1):
-        test_bar = bar_min + (gamma_rod_length - bar_min) * i / steps
-        if test_bar <= 0:
-            continue
-        # Get stub + antenna reactance at this bar
-        _, ti = _eval(test_bar, 0.001)
-        xs = ti.get("x_stub", 0)
-        xa = ti.get("x_antenna", 0)
-        k_at_bar = ti.get("step_up_ratio", 1.0)
-        total_pos_x = xa * k_at_bar + xs  # antenna X * K + stub
-        if total_pos_x <= 0:
-            continue
-        # Analytical null cap for this bar
-        c_need = 1e12 / (omega * total_pos_x)
-        ins_need = c_need / cap_per_inch
-        if ins_need <= max_insertion:
-            test_cap = c_need
-        else:
-            test_cap = max_insertion * cap_per_inch
-        s, _ = _eval(test_bar, test_cap)
-        if s < best_swr_opt:
-            best_swr_opt = s
-            best_bar_opt = test_bar
-            best_cap_opt = test_cap
+    bars = bar_min + bar_span * np.arange(steps + 1) / steps
+    k_bars, xs_bars = _gamma_reactance_kernel(bars, z0_gamma, kernel_half_len, frequency_mhz)
+    total_pos_x = x_antenna_at_center * _round_each(k_bars, 3) + _round_each(xs_bars, 2)  # antenna X * K + stub
+    # Only bars with net positive reactance have a null cap; the SWR is evaluated for those alone
+    valid = (bars > 0) & (total_pos_x > 0)
+    if valid.any():
+        bars, k_bars, xs_bars, total_pos_x = bars[valid], k_bars[valid], xs_bars[valid], total_pos_x[valid]
+        # Analytical null cap for each bar, limited by the available insertion
+        c_need = pf_ohms / total_pos_x
+        test_caps = np.where(c_need / cap_per_inch <= max_insertion, c_need, max_insertion * cap_per_inch)
+        swr_bars = _gamma_swr_kernel(k_bars, xs_bars, test_caps, r_feed, x_ant, frequency_mhz)[4]
+        swr_bars = np.maximum(_round_each(swr_bars, 3), 1.0)
+        # First bar with the lowest SWR, as a strict < scan would pick
+        best_i = int(np.argmin(swr_bars))
+        if swr_bars[best_i] < best_swr_opt:
+            best_swr_opt = swr_bars[best_i].item()
+            best_bar_opt = bars[best_i].item()
+            best_cap_opt = test_caps[best_i].item()
     optimized_bar = best_bar_opt
     bar_ideal_clamped = optimized_bar
     # Re-check null reachability at optimized bar
-    _, stub_opt = _eval(optimized_bar, 0.001)
-    xs_opt = stub_opt.get("x_stub", 0)
-    xa_opt = stub_opt.get("x_antenna", 0)
-    k_opt = stub_opt.get("step_up_ratio", 1.0)
-    total_x_opt = xa_opt * k_opt + xs_opt
+    k_opt, xs_opt = _reactances(optimized_bar)
+    total_x_opt = x_antenna_at_center * k_opt + xs_opt
     if total_x_opt > 0:
-        c_opt = 1e12 / (omega * total_x_opt)
+        c_opt = pf_ohms / total_x_opt
         ins_opt = c_opt / cap_per_inch
         null_reachable = ins_opt <= max_insertion
         if null_reachable:
@@ -2429,36 +2801,17 @@ def design_gamma_match(num_elements: int, driven_element_length_in: float,
     matched_swr, null_info = _eval(bar_ideal_clamped, optimal_cap_pf)
 
     swr_val = matched_swr
-    rl_val = round(-20 * math.log10(max(null_info.get("reflection_coefficient", 0.001), 1e-8)), 2)
-    rl_val = min(rl_val, 80.0)
-    z_r = null_info.get("z_matched_r", 50.0)
-    z_x = null_info.get("z_matched_x", 0.0)
-    actual_cap = null_info.get("insertion_cap_pf", 0)
-    k_at_ideal = null_info.get("step_up_ratio", 1.0)
-
-    # Bar sweep: from bar_min to rod length (bar can't go below teflon end)
-    bar_sweep = []
-    for b_pct in range(0, 105, 5):
-        b = bar_min + (gamma_rod_length - bar_min) * b_pct / 100.0
-        s, info_b = _eval(b, optimal_cap_pf)
-        bar_sweep.append({
-            "bar_inches": round(b, 2), "k": info_b.get("step_up_ratio", 1.0),
-            "r_matched": info_b.get("z_matched_r", 0), "x_net": info_b.get("net_reactance", 0),
-            "swr": max(1.0, s),
-        })
-
-    # Insertion sweep: use apply_matching_network for each point
-    ins_sweep = []
-    for i_pct in range(0, 105, 5):
-        ins = max_insertion * i_pct / 100.0
-        if ins <= 0:
-            ins = 0.001
-        cap_at_ins = ins * cap_per_inch
-        s, info_i = _eval(bar_ideal_clamped, cap_at_ins)
-        ins_sweep.append({
-            "insertion_inches": round(ins, 2), "cap_pf": round(cap_at_ins, 2),
-            "x_net": info_i.get("net_reactance", 0), "swr": max(1.0, s),
-        })
+    rl_val = null_info.return_loss_db
+    z_r = null_info.z_matched_r
+    z_x = null_info.z_matched_x
+    actual_cap = null_info.insertion_cap_pf
+    k_at_ideal = null_info.step_up_ratio
+
+    # Bar sweep (bar_min to rod length; bar can't go below teflon end) and
+    # insertion sweep, each evaluated as one array pass
+    bar_sweep, ins_sweep = _gamma_report_sweeps(
+        bar_min, gamma_rod_length, max_insertion, cap_per_inch, bar_ideal_clamped, optimal_cap_pf,
+        z0_gamma, kernel_half_len, r_feed, x_ant, frequency_mhz)
 
     # Notes
     notes = []
@@ -2481,21 +2834,9 @@ def design_gamma_match(num_elements: int, driven_element_length_in: float,
             up_tube_len = upgrade["tube_length"]
             up_tube_id = up_tube_od - 2 * wall
             up_max_ins = up_tube_len - 0.5
-            up_cap_per_inch = 1.413 * 2.1 / math.log(up_tube_id / up_rod)
+            up_cap_per_inch = _gamma_cap_per_inch(up_tube_id, up_rod)
             up_teflon = up_tube_len + 1.0
-
-            def _eval_up(bar_u: float, ins_u: float) -> tuple:
-                return apply_matching_network(
-                    swr=swr_unmatched, feed_type='gamma', feedpoint_r=r_feed,
-                    gamma_rod_dia=up_rod, gamma_rod_spacing=rod_spacing,
-                    gamma_bar_pos=bar_u, gamma_element_gap=ins_u,
-                    gamma_cap_pf=None, gamma_tube_od=up_tube_od,
-                    operating_freq_mhz=frequency_mhz,
-                    num_elements=num_elements,
-                    driven_element_half_length_in=half_len,
-                    driven_element_dia_in=driven_element_dia,
-                    element_resonant_freq_mhz=element_res_freq,
-                )
+            up_z0_gamma = _gamma_z0(driven_element_dia, up_rod, rod_spacing)
 
             # Sweep bar positions to find best SWR
             up_best_swr = 999.0
@@ -2503,40 +2844,34 @@ def design_gamma_match(num_elements: int, driven_element_length_in: float,
             up_best_ins = 0.0
             up_bar_min = max(1.0, up_tube_len * 0.6) if r_feed > 30 else up_teflon
             up_rod_len = hw["rod_length"]
-            _, up_probe = _eval_up(13.0, 8.0)
-            up_coupling = up_probe.get("coupling_multiplier", 4.5)
-            up_x_ant = up_probe.get("x_antenna", 0)
-            omega_up = 2.0 * math.pi * frequency_mhz * 1e6
-
-            for i in range(201):
-                test_bar = up_bar_min + (up_rod_len - up_bar_min) * i / 200
-                if test_bar <= 0:
-                    continue
-                _, ti = _eval_up(test_bar, 0.001)
-                xs = ti.get("x_stub", 0)
-                xa = ti.get("x_antenna", 0)
-                k_b = ti.get("step_up_ratio", 1.0)
-                total_x = xa * k_b + xs
-                if total_x <= 0:
-                    continue
-                c_need = 1e12 / (omega_up * total_x)
-                ins_need = c_need / up_cap_per_inch
-                test_ins = ins_need if ins_need <= up_max_ins else up_max_ins
-                s, _ = _eval_up(test_bar, test_ins)
-                if s < up_best_swr:
-                    up_best_swr = s
-                    up_best_bar = test_bar
-                    up_best_ins = test_ins
+            up_bar_span = up_rod_len - up_bar_min
+
+            # One array pass over the bars: null insertion per bar (capped at this tube),
+            # then SWR with that insertion clamped to the default tube's range, as
+            # apply_matching_network does for a gamma_element_gap
+            up_bars = up_bar_min + up_bar_span * np.arange(201) / 200
+            up_k_bars, up_xs_bars = _gamma_reactance_kernel(up_bars, up_z0_gamma, kernel_half_len, frequency_mhz)
+            up_total_pos_x = x_antenna_at_center * _round_each(up_k_bars, 3) + _round_each(up_xs_bars, 2)
+            up_valid = (up_bars > 0) & (up_total_pos_x > 0)
+            if up_valid.any():
+                up_bars, up_total_pos_x = up_bars[up_valid], up_total_pos_x[up_valid]
+                up_test_ins = np.minimum(pf_ohms / up_total_pos_x / up_cap_per_inch, up_max_ins)
+                up_caps = up_cap_per_inch * np.clip(up_test_ins, 0, hw["tube_length"] - 0.5)
+                up_swrs = _gamma_swr_kernel(up_k_bars[up_valid], up_xs_bars[up_valid], up_caps,
+                                            r_feed, x_ant, frequency_mhz)[4]
+                up_swrs = np.maximum(_round_each(up_swrs, 3), 1.0)
+                up_i = int(np.argmin(up_swrs))
+                if up_swrs[up_i] < up_best_swr:
+                    up_best_swr = up_swrs[up_i].item()
+                    up_best_bar = up_bars[up_i].item()
+                    up_best_ins = up_test_ins[up_i].item()
 
             # Check if this upgrade reaches the null
-            _, up_check = _eval_up(up_best_bar, 0.001)
-            up_xs = up_check.get("x_stub", 0)
-            up_xa = up_check.get("x_antenna", 0)
-            up_k = up_check.get("step_up_ratio", 1.0)
-            up_total_x = up_xa * up_k + up_xs
+            up_k, up_xs = _reactances(up_best_bar, up_z0_gamma)
+            up_total_x = x_antenna_at_center * up_k + up_xs
             up_null_ok = False
             if up_total_x > 0:
-                up_c = 1e12 / (omega_up * up_total_x)
+                up_c = pf_ohms / up_total_x
                 up_ins_need = up_c / up_cap_per_inch
                 up_null_ok = up_ins_need <= up_max_ins
 
@@ -2553,18 +2888,12 @@ def design_gamma_match(num_elements: int, driven_element_length_in: float,
                 bar_min = max(1.0, up_tube_len * 0.6) if r_feed > 30 else up_teflon
 
                 # Redo _eval with new hardware
+                up_nominal_cap_pf = round(cap_per_inch * 8.0, 1)
+
+                @lru_cache(maxsize=None)
                 def _eval(bar: float, cap_pf: float) -> tuple:
-                    return apply_matching_network(
-                        swr=swr_unmatched, feed_type='gamma', feedpoint_r=r_feed,
-                        gamma_rod_dia=rod_od, gamma_rod_spacing=rod_spacing,
-                        gamma_bar_pos=bar, gamma_cap_pf=cap_pf if cap_pf > 0 else 0.001,
-                        gamma_tube_od=tube_od,
-                        operating_freq_mhz=frequency_mhz,
-                        num_elements=num_elements,
-                        driven_element_half_length_in=half_len,
-                        driven_element_dia_in=driven_element_dia,
-                        element_resonant_freq_mhz=element_res_freq,
-                    )
+                    return _gamma_point(bar, cap_pf if cap_pf > 0 else 0.001, up_z0_gamma, kernel_half_len,
+                                        r_feed, x_ant, frequency_mhz, up_nominal_cap_pf)
 
                 bar_ideal_clamped = up_best_bar
                 optimal_insertion = up_best_ins
@@ -2579,34 +2908,16 @@ def design_gamma_match(num_elements: int, driven_element_length_in: float,
                 # Get final values
                 matched_swr, null_info = _eval(bar_ideal_clamped, optimal_cap_pf)
                 swr_val = matched_swr
-                rl_val = round(-20 * math.log10(max(null_info.get("reflection_coefficient", 0.001), 1e-8)), 2)
-                rl_val = min(rl_val, 80.0)
-                z_r = null_info.get("z_matched_r", 50.0)
-                z_x = null_info.get("z_matched_x", 0.0)
-                actual_cap = null_info.get("insertion_cap_pf", 0)
-                k_at_ideal = null_info.get("step_up_ratio", 1.0)
+                rl_val = null_info.return_loss_db
+                z_r = null_info.z_matched_r
+                z_x = null_info.z_matched_x
+                actual_cap = null_info.insertion_cap_pf
+                k_at_ideal = null_info.step_up_ratio
 
                 # Redo sweeps
-                bar_sweep = []
-                for b_pct in range(0, 105, 5):
-                    b = bar_min + (gamma_rod_length - bar_min) * b_pct / 100.0
-                    s, info_b = _eval(b, optimal_cap_pf)
-                    bar_sweep.append({
-                        "bar_inches": round(b, 2), "k": info_b.get("step_up_ratio", 1.0),
-                        "r_matched": info_b.get("z_matched_r", 0), "x_net": info_b.get("net_reactance", 0),
-                        "swr": max(1.0, s),
-                    })
-                ins_sweep = []
-                for i_pct in range(0, 105, 5):
-                    ins = max_insertion * i_pct / 100.0
-                    if ins <= 0:
-                        ins = 0.001
-                    cap_at_ins = ins * cap_per_inch
-                    s, info_i = _eval(bar_ideal_clamped, cap_at_ins)
-                    ins_sweep.append({
-                        "insertion_inches": round(ins, 2), "cap_pf": round(cap_at_ins, 2),
-                        "x_net": info_i.get("net_reactance", 0), "swr": max(1.0, s),
-                    })
+                bar_sweep, ins_sweep = _gamma_report_sweeps(
+                    bar_min, gamma_rod_length, max_insertion, cap_per_inch, bar_ideal_clamped, optimal_cap_pf,
+                    up_z0_gamma, kernel_half_len, r_feed, x_ant, frequency_mhz)
 
                 hardware_upgraded = True
                 notes.append(f"Auto-upgraded hardware: {upgrade['label']} (standard hardware couldn't reach null at this impedance)")
@@ -2667,6 +2978,17 @@ def design_gamma_match(num_elements: int, driven_element_length_in: float,
     }
 
 
+def _hairpin_z0(rod_dia_in: float, rod_spacing_in: float) -> float:
+    """Z0 of the hairpin designer's two-wire rods (200 Ω if too close)."""
+    if rod_spacing_in > rod_dia_in / 2:
+        return 276.0 * math.log10(2.0 * rod_spacing_in / rod_dia_in)
+    return 200.0
+
+
+_HAIRPIN_ROD_DIAS = (0.125, 0.1875, 0.25, 0.3125, 0.375)
+_HAIRPIN_ROD_SPACINGS = (0.5, 0.75, 1.0, 1.25, 1.5, 2.0)
+
+
 def design_hairpin_match(num_elements: int, frequency_mhz: float,
                           driven_element_length_in: float,
                           reflector_spacing_in: float = None,
@@ -2676,9 +2998,30 @@ def design_hairpin_match(num_elements: int, frequency_mhz: float,
                           custom_rod_dia: float = None,
                           custom_rod_spacing: float = None,
                           element_diameter: float = 0.5) -> dict:
-    """Design a hairpin (beta) match using complex impedance + reflection coefficient."""
-    wavelength_m = 299792458.0 / (frequency_mhz * 1e6)
-    wl_in = wavelength_m * 39.3701
+    """Design a hairpin (beta) match using complex impedance + reflection coefficient.
+
+    Results are cached by input; each call returns its own copy of the cached design.
+    """
+    return copy.deepcopy(_design_hairpin_match(
+        num_elements, frequency_mhz, driven_element_length_in, reflector_spacing_in,
+        tuple(director_spacings_in) if director_spacings_in is not None else None,
+        feedpoint_impedance, element_resonant_freq_mhz, custom_rod_dia, custom_rod_spacing,
+        element_diameter,
+    ))
+
+
+@lru_cache(maxsize=512)
+def _design_hairpin_match(num_elements: int, frequency_mhz: float,
+                          driven_element_length_in: float,
+                          reflector_spacing_in: float,
+                          director_spacings_in: tuple,
+                          feedpoint_impedance: float,
+                          element_resonant_freq_mhz: float,
+                          custom_rod_dia: float,
+                          custom_rod_spacing: float,
+                          element_diameter: float) -> dict:
+    wavelength_m = C_MPS / (frequency_mhz * 1e6)
+    wl_in = wavelength_m * M_TO_IN
     half_len = driven_element_length_in / 2.0
     refl_gap_in = reflector_spacing_in if reflector_spacing_in and reflector_spacing_in > 0 else 48.0
 
@@ -2730,55 +3073,40 @@ def design_hairpin_match(num_elements: int, frequency_mhz: float,
     shorten_per_side = xc_needed * wl_in / (4.0 * math.pi * z_char) if z_char > 0 else 0
     shortened_total = (half_len - shorten_per_side) * 2.0
 
-    # Hardware candidates: try different rod dia + spacing combos
-    rod_dias = [0.125, 0.1875, 0.25, 0.3125, 0.375]
-    rod_spacings = [0.5, 0.75, 1.0, 1.25, 1.5, 2.0]
-    candidates = []
-
-    for rd in rod_dias:
-        for rs in rod_spacings:
-            if rs <= rd / 2:
-                continue
-            z0 = 276.0 * math.log10(2.0 * rs / rd)
-            ideal_len = (math.atan(xl_needed / z0) / (2.0 * math.pi)) * wl_in
-            # Score: prefer practical lengths (8-36"), reasonable Z0
-            if ideal_len < 2 or ideal_len > wl_in / 4:
-                continue
-            # Practical score: closer to 12-24" is better
-            center = 18.0
-            length_score = abs(ideal_len - center) / center
-            candidates.append({
-                "rod_dia": rd, "rod_spacing": rs, "z0": round(z0, 1),
-                "ideal_length_in": round(ideal_len, 2), "score": length_score,
-            })
-
-    if not candidates:
-        # Fallback to defaults
-        rd = custom_rod_dia if custom_rod_dia and custom_rod_dia > 0 else 0.25
-        rs = custom_rod_spacing if custom_rod_spacing and custom_rod_spacing > 0 else 1.0
-        z0 = 276.0 * math.log10(2.0 * rs / rd) if rs > rd / 2 else 200.0
-        ideal_len = (math.atan(xl_needed / z0) / (2.0 * math.pi)) * wl_in
-        candidates = [{"rod_dia": rd, "rod_spacing": rs, "z0": round(z0, 1),
-                        "ideal_length_in": round(ideal_len, 2), "score": 0}]
-
     # If user specified custom hardware, use it; otherwise pick best candidate
     if custom_rod_dia and custom_rod_dia > 0 and custom_rod_spacing and custom_rod_spacing > 0:
         rd = custom_rod_dia
         rs = custom_rod_spacing
-        z0 = 276.0 * math.log10(2.0 * rs / rd) if rs > rd / 2 else 200.0
-        ideal_len = (math.atan(xl_needed / z0) / (2.0 * math.pi)) * wl_in
+        z0 = _hairpin_z0(rd, rs)
+        ideal_len = (math.atan(xl_needed / z0) / TWO_PI) * wl_in
         best = {"rod_dia": rd, "rod_spacing": rs, "z0": round(z0, 1), "ideal_length_in": round(ideal_len, 2)}
         hw_source = "custom"
     else:
-        candidates.sort(key=lambda c: c["score"])
-        best = candidates[0]
+        # Hardware candidates: every rod dia + spacing combo as one grid
+        rd_arr, rs_arr = np.meshgrid(np.array(_HAIRPIN_ROD_DIAS), np.array(_HAIRPIN_ROD_SPACINGS), indexing="ij")
+        z0_arr = 276.0 * np.log10(2.0 * rs_arr / rd_arr)
+        ideal_arr = (np.arctan(xl_needed / z0_arr) / TWO_PI) * wl_in
+        usable = (rs_arr > rd_arr / 2) & (ideal_arr >= 2) & (ideal_arr <= wl_in / 4)
+        if usable.any():
+            # Practical score: closer to 12-24" is better
+            center = 18.0
+            score = np.where(usable, np.abs(ideal_arr - center) / center, np.inf)
+            idx = np.unravel_index(np.argmin(score), score.shape)
+            rd, rs = rd_arr[idx].item(), rs_arr[idx].item()
+            z0, ideal_len = z0_arr[idx].item(), ideal_arr[idx].item()
+        else:
+            # Fallback to defaults
+            rd = custom_rod_dia if custom_rod_dia and custom_rod_dia > 0 else 0.25
+            rs = custom_rod_spacing if custom_rod_spacing and custom_rod_spacing > 0 else 1.0
+            z0 = _hairpin_z0(rd, rs)
+            ideal_len = (math.atan(xl_needed / z0) / TWO_PI) * wl_in
+        best = {"rod_dia": rd, "rod_spacing": rs, "z0": round(z0, 1), "ideal_length_in": round(ideal_len, 2)}
         hw_source = "auto"
 
     z0_best = best["z0"]
     ideal_length = best["ideal_length_in"]
 
     # SWR sweep: vary hairpin length
-    length_sweep = []
     sweep_min = max(2.0, ideal_length * 0.3)
     sweep_max = min(wl_in / 4.0 - 1.0, ideal_length * 2.5)
     sweep_steps = 60
@@ -2787,42 +3115,41 @@ def design_hairpin_match(num_elements: int, frequency_mhz: float,
     best_swr = 999.0
     best_length = ideal_length
 
-    for i in range(sweep_steps + 1):
-        length = sweep_min + i * step_size
-        beta_l = (2.0 * math.pi * length) / wl_in
-        if abs(beta_l) >= math.pi / 2.0 - 0.01:
-            continue
-        xl_act = z0_best * math.tan(beta_l)
-
-        # Complex impedance calculation
-        z_feed = complex(r_feed, -xc_needed)
-        z_hp = complex(0, xl_act)
-        z_sum = z_feed + z_hp
-        if abs(z_sum) < 0.001:
-            continue
-        z_in = (z_feed * z_hp) / z_sum
-
-        gamma_c = (z_in - 50.0) / (z_in + 50.0)
-        gamma_m = abs(gamma_c)
-        swr_val = (1.0 + gamma_m) / (1.0 - gamma_m) if gamma_m < 0.99 else 99.0
-
-        # Power (5W reference)
-        p_refl = 5.0 * gamma_m ** 2
-
-        pt = {
-            "length_in": round(length, 2),
-            "swr": round(swr_val, 3),
-            "xl_actual": round(xl_act, 2),
-            "z_in_r": round(z_in.real, 2),
-            "z_in_x": round(z_in.imag, 2),
-            "gamma": round(gamma_m, 4),
-            "p_reflected_w": round(p_refl, 3),
-        }
-        length_sweep.append(pt)
-
-        if swr_val < best_swr:
-            best_swr = swr_val
-            best_length = length
+    # Whole sweep as one array pass; points with beta*L near 90 degrees are dropped
+    lengths = sweep_min + np.arange(sweep_steps + 1) * step_size
+    beta_l = (TWO_PI * lengths) / wl_in
+    in_range = np.abs(beta_l) < math.pi / 2.0 - 0.01
+    lengths, beta_l = lengths[in_range], beta_l[in_range]
+    xl_act = z0_best * np.tan(beta_l)
+
+    # Impedance in real arithmetic: Z_in = Z_feed * jX_L / (Z_feed + jX_L),
+    # Z_feed = R_feed - jX_C
+    sum_x = xl_act - xc_needed
+    keep = np.hypot(r_feed, sum_x) >= 0.001
+    lengths, xl_act, sum_x = lengths[keep], xl_act[keep], sum_x[keep]
+    num_r = xc_needed * xl_act
+    num_x = r_feed * xl_act
+    den_sq = r_feed * r_feed + sum_x * sum_x
+    z_in_r = (num_r * r_feed + num_x * sum_x) / den_sq
+    z_in_x = (num_x * r_feed - num_r * sum_x) / den_sq
+
+    gamma_m = np.hypot(z_in_r - 50.0, z_in_x) / np.hypot(z_in_r + 50.0, z_in_x)
+    swr_vals = np.where(gamma_m < 0.99, (1.0 + gamma_m) / (1.0 - gamma_m), 99.0)
+
+    # Power (5W reference)
+    p_refl = 5.0 * gamma_m ** 2
+
+    length_sweep = [
+        {"length_in": round(length, 2), "swr": round(swr_val, 3), "xl_actual": round(xl, 2),
+         "z_in_r": round(zr, 2), "z_in_x": round(zx, 2), "gamma": round(gm, 4), "p_reflected_w": round(pr, 3)}
+        for length, swr_val, xl, zr, zx, gm, pr in zip(
+            lengths.tolist(), swr_vals.tolist(), xl_act.tolist(), z_in_r.tolist(),
+            z_in_x.tolist(), gamma_m.tolist(), p_refl.tolist())
+    ]
+    if len(swr_vals) and swr_vals.min() < best_swr:
+        best_idx = int(np.argmin(swr_vals))
+        best_swr = swr_vals[best_idx].item()
+        best_length = lengths[best_idx].item()
 
     # Build recipe
     recipe = {
@@ -2871,6 +3198,25 @@ def design_hairpin_match(num_elements: int, frequency_mhz: float,
 
 # ── Gamma Fine-Tune: Optimize elements for best gamma match ──
 
+def _split_elements(elems):
+    """Partition element dicts in one pass into (reflector, driven, directors by position).
+
+    The first reflector/driven found wins; either is None when absent.
+    """
+    refl = driven = None
+    dirs = []
+    for e in elems:
+        t = e["element_type"]
+        if t == "reflector":
+            if refl is None: refl = e
+        elif t == "driven":
+            if driven is None: driven = e
+        elif t == "director":
+            dirs.append(e)
+    dirs.sort(key=lambda x: x["position"])
+    return refl, driven, dirs
+
+
 def _fast_gamma_swr(test_elems, n, freq, dia, hw):
     """Fast analytical gamma SWR estimate — avoids the 200-step sweep.
 
@@ -2878,13 +3224,11 @@ def _fast_gamma_swr(test_elems, n, freq, dia, hw):
     apply_matching_network at the analytically-optimal (bar, insertion) point.
     Returns estimated SWR and metadata.  ~100x faster than design_gamma_match.
     """
-    refl = next(e for e in test_elems if e["element_type"] == "reflector")
-    driven = next(e for e in test_elems if e["element_type"] == "driven")
-    dirs = sorted([e for e in test_elems if e["element_type"] == "director"], key=lambda x: x["position"])
+    refl, driven, dirs = _split_elements(test_elems)
     refl_sp = abs(driven["position"] - refl["position"])
     dir_sp = [abs(d["position"] - driven["position"]) for d in dirs]
 
-    wavelength_m = 299792458.0 / (freq * 1e6)
+    wavelength_m = C_MPS / (freq * 1e6)
 
     # Fast impedance + resonant freq (pure math, no sweeps)
     r_feed = compute_feedpoint_impedance(
@@ -2912,16 +3256,15 @@ def _fast_gamma_swr(test_elems, n, freq, dia, hw):
     rod_spacing = hw["rod_spacing"]
     tube_length = hw["tube_length"]
     max_insertion = tube_length - 0.5
-    omega = 2.0 * math.pi * freq * 1e6
+    omega = TWO_PI * freq * 1e6
 
     if tube_id <= rod_od:
         return {"swr": 99.0, "reachable": False, "z": r_feed}
 
-    cap_per_inch = 1.413 * 2.1 / math.log(tube_id / rod_od)
+    cap_per_inch = _gamma_cap_per_inch(tube_id, rod_od)
 
     # Z0 of gamma section
-    geo_mean = math.sqrt(dia * rod_od)
-    z0_gamma = 276.0 * math.log10(2.0 * rod_spacing / geo_mean) if rod_spacing > geo_mean / 2 else 300.0
+    z0_gamma = _gamma_z0(dia, rod_od, rod_spacing)
     coupling_mult = z0_gamma / 73.0
     swr_unmatched = max(50.0 / max(r_feed, 1), r_feed / 50.0)
 
@@ -2929,7 +3272,7 @@ def _fast_gamma_swr(test_elems, n, freq, dia, hw):
     k_ideal = math.sqrt(50.0 / max(r_feed, 5.0))
     bar_ideal = half_len * (k_ideal - 1.0) / coupling_mult
     bar_min = max(1.0, tube_length * 0.6) if r_feed > 30 else tube_length + 1.0
-    bar_ideal = max(bar_min, min(bar_ideal, hw["rod_length"]))
+    bar_ideal = _clamp(bar_ideal, bar_min, hw["rod_length"])
 
     # Evaluate at ideal bar to get stub + antenna reactance
     _, info = apply_matching_network(
@@ -3062,9 +3405,7 @@ def gamma_fine_tune(request: GammaFineTuneRequest) -> GammaFineTuneOutput:
         fz = gd.get("feedpoint_impedance_ohms", 50)
         res_freq = calc_out.matching_info.get("element_resonant_freq_mhz", freq) if calc_out.matching_info else freq
 
-        refl = next(e for e in test_elems if e["element_type"] == "reflector")
-        driven = next(e for e in test_elems if e["element_type"] == "driven")
-        dirs = sorted([e for e in test_elems if e["element_type"] == "director"], key=lambda x: x["position"])
+        refl, driven, dirs = _split_elements(test_elems)
         refl_sp = abs(driven["position"] - refl["position"])
         dir_sp = [abs(d["position"] - driven["position"]) for d in dirs]
 
@@ -3094,7 +3435,7 @@ def gamma_fine_tune(request: GammaFineTuneRequest) -> GammaFineTuneOutput:
     #  - Impedance in optimal gain range (18-26 ohms for high-gain Yagis)
     #  - Gamma-matched SWR (must stay low)
     #  - Boom length relative to standard (longer = more gain)
-    wavelength_m = 299792458.0 / (freq * 1e6)
+    wavelength_m = C_MPS / (freq * 1e6)
     wavelength_in = wavelength_m / 0.0254
     std_boom = get_standard_boom_in(n, wavelength_in)
 